@@ -0,0 +1,20 @@
+"""
+Heart Disease Prediction System - Web Server Settings
+Gunicorn configuration for serving the web version: gunicorn heart_disease_web:app
+"""
+
+import os
+import multiprocessing
+
+bind = '0.0.0.0:5000'
+
+# Load the app once in the master so the model is read (or trained) a single time;
+# forked workers share its pages copy-on-write
+preload_app = True
+
+# One single-threaded worker per core (the app pins BLAS/OpenMP to one thread)
+workers = multiprocessing.cpu_count()
+
+def post_worker_init(worker):
+    """Tell the app how many workers run, so it refuses admin routes that would change only one"""
+    os.environ['HEART_WEB_WORKERS'] = str(worker.cfg.workers)
@@ -6,21 +6,156 @@ A comprehensive GUI application with data storage and professional interface
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import pandas as pd
-import numpy as np
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score
 import os
+import array
+import atexit
+import csv
+import glob
+import hashlib
+import shutil
+import functools
+import weakref
 import threading
+import concurrent.futures
 from datetime import datetime
-import json
+
+# Prefer orjson for the small state files, falling back to the stdlib
+try:
+    import orjson
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+    
+    json_loads = json.loads
+
+# Input fields: (feature, label, description, min, max, color)
+FEATURES = (
+    ('age', 'Age (years)', 'Patient age', 1, 120, '#3498db'),
+    ('sex', 'Sex', '0=Female, 1=Male', 0, 1, '#e91e63'),
+    ('cp', 'Chest Pain Type', '0=Typical, 1=Atypical, 2=Non-anginal, 3=Asymptomatic', 0, 3, '#ff9800'),
+    ('trestbps', 'Resting BP (mmHg)', 'Resting blood pressure', 50, 300, '#f44336'),
+    ('chol', 'Cholesterol (mg/dl)', 'Serum cholesterol level', 100, 600, '#9c27b0'),
+    ('fbs', 'Fasting Blood Sugar', 'FBS > 120 mg/dl (0=No, 1=Yes)', 0, 1, '#4caf50'),
+    ('restecg', 'Resting ECG', '0=Normal, 1=ST-T abnormal, 2=LV hypertrophy', 0, 2, '#00bcd4'),
+    ('thalach', 'Max Heart Rate', 'Maximum heart rate achieved', 50, 250, '#ff5722'),
+    ('exang', 'Exercise Angina', 'Exercise induced angina (0=No, 1=Yes)', 0, 1, '#795548'),
+    ('oldpeak', 'ST Depression', 'ST depression by exercise', 0.0, 10.0, '#607d8b'),
+    ('slope', 'ST Slope', '0=Upsloping, 1=Flat, 2=Downsloping', 0, 2, '#8bc34a'),
+    ('ca', 'Major Vessels', 'Vessels colored by fluoroscopy (0-4)', 0, 4, '#ffc107'),
+    ('thal', 'Thalassemia', '0=Normal, 1=Fixed, 2=Reversible, 3=Not described', 0, 3, '#673ab7')
+)
+
+# Column order expected by the model
+FEATURE_ORDER = tuple(feature for feature, *_ in FEATURES)
+
+# Columns of the saved predictions file
+FIELDNAMES = FEATURE_ORDER + ('target', 'risk_score', 'confidence', 'timestamp')
+
+# Compact column types for reading the training dataset
+DTYPES = {
+    'age': 'int16', 'sex': 'int8', 'cp': 'int8', 'trestbps': 'int16',
+    'chol': 'int16', 'fbs': 'int8', 'restecg': 'int8', 'thalach': 'int16',
+    'exang': 'int8', 'oldpeak': 'float32', 'slope': 'int8', 'ca': 'int8',
+    'thal': 'int8', 'target': 'int8'
+}
+
+# Column types for reading the saved predictions file (oldpeak kept
+# at full precision so the viewer shows the value as entered)
+SAVED_DTYPES = {**DTYPES, 'oldpeak': 'float64', 'risk_score': 'float64',
+                'confidence': 'float64', 'timestamp': 'str'}
+
+# Tk roots whose ttk styles have been configured
+_STYLED_ROOTS = weakref.WeakSet()
+
+# Consented records between full refits; smaller batches only nudge the weights
+REFIT_AFTER = 50
+
+def _line_tags(parts):
+    """Join (text, tag) parts of whole lines and compute each tag's line range"""
+    # Tag by line range; character offsets drift on emoji in Tk
+    tags = []
+    line = 1
+    for text, tag in parts:
+        n_lines = text.count('\n')
+        if tag:
+            # A part without a trailing newline ends partway through its last line
+            end = f'{line + n_lines}.0' if text.endswith('\n') else f'{line + n_lines}.end'
+            tags.append((tag, f'{line}.0', end))
+        line += n_lines
+    return ''.join(text for text, _ in parts), tuple(tags)
+
+def logistic_scores(X, w, b):
+    """Class-1 probabilities for every row of X in one matrix-vector product"""
+    from scipy.special import expit
+    
+    z = X @ w
+    z += b
+    return expit(z, out=z)
+
+# Static results-area text, joined and measured once
+_STYLED_WELCOME_TEXT, _STYLED_WELCOME_TAGS = _line_tags((
+    # Welcome header
+    ("🏥 Heart Disease Risk Assessment System\n\n", 'header'),
+    
+    # Instructions
+    ("Welcome to the Professional Medical Risk Assessment Tool\n\n", None),
+    ("📋 Instructions:\n", 'info'),
+    ("1. Fill in all patient information fields above\n"
+     "2. Click 'Predict Heart Disease Risk' to get assessment\n"
+     "3. Review the detailed risk analysis and recommendations\n"
+     "4. Save predictions for future reference and analysis\n\n", None),
+    
+    # Features
+    ("✨ Key Features:\n", 'success'),
+    ("• Advanced machine learning risk prediction\n"
+     "• Comprehensive patient data management\n"
+     "• Visual risk level interpretation\n"
+     "• Data export and analysis capabilities\n"
+     "• Continuous model improvement\n\n", None),
+    
+    # Medical disclaimer
+    ("⚠️  IMPORTANT MEDICAL DISCLAIMER:\n", 'warning'),
+    ("This tool is designed for educational and research purposes only.\n"
+     "Always consult qualified healthcare professionals for medical advice.\n"
+     "Do not use this tool as a substitute for professional medical diagnosis.\n", 'info'),
+))
+
+_WELCOME_TEXT = ("🏥 Heart Disease Risk Assessment System\n\n"
+                 "Enter patient information above and click 'Predict Heart Disease Risk' to get results.\n\n"
+                 "Features:\n"
+                 "• Professional medical risk assessment\n"
+                 "• Save predictions for future reference\n"
+                 "• Export data for analysis\n"
+                 "• Continuous model improvement\n\n"
+                 "⚠️  This tool is for educational purposes only.\n"
+                 "Always consult healthcare professionals for medical advice.")
+
+# Closing block of every results report
+_DISCLAIMER_TEXT = ("⚠️  MEDICAL DISCLAIMER:\n"
+                    "This prediction is for educational purposes only.\n"
+                    "Always consult healthcare professionals for medical advice.\n"
+                    + "=" * 70 + "\n")
 
 class HeartDiseaseApp:
     def __init__(self):
         self.model = None
         self.data_file = 'heart_disease_data.csv'
         self.user_data_file = 'user_predictions.csv'
+        self.accuracy_file = 'accuracy.json'
+        self._saved_n = self.count_saved_predictions()
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        # Single I/O worker keeps file appends in submission order
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._cache_lock = threading.RLock()
+        # Consented records for the main dataset, written in one go
+        self._pending_main_records = []
+        # Training data kept in memory, valid while the file is data_size bytes
+        self._X = self._y = self._data_size = None
+        atexit.register(self.flush_pending_records)
         self.setup_gui()
         self.load_model_async()
         
@@ -39,9 +174,6 @@ class HeartDiseaseApp:
         
     def setup_styles(self):
         """Configure custom styles with colors and graphics"""
-        style = ttk.Style()
-        style.theme_use('clam')
-        
         # Color scheme - Medical Blue Theme
         self.colors = {
             'primary_blue': '#2E86AB',
@@ -55,67 +187,69 @@ class HeartDiseaseApp:
             'text_dark': '#2C3E50',
             'text_light': '#7F8C8D'
         }
+        colors = self.colors
         
         # Configure root background
-        self.root.configure(bg=self.colors['background'])
-        
-        # Title styles with gradient effect
-        style.configure('Title.TLabel', 
-                       font=('Segoe UI', 20, 'bold'), 
-                       background=self.colors['background'], 
-                       foreground=self.colors['primary_blue'])
-        
-        style.configure('Subtitle.TLabel', 
-                       font=('Segoe UI', 12, 'bold'), 
-                       background=self.colors['card_bg'], 
-                       foreground=self.colors['text_dark'])
-        
-        style.configure('Info.TLabel', 
-                       font=('Segoe UI', 10), 
-                       background=self.colors['card_bg'], 
-                       foreground=self.colors['text_light'])
-        
-        style.configure('Success.TLabel', 
-                       font=('Segoe UI', 11, 'bold'), 
-                       background=self.colors['background'], 
-                       foreground=self.colors['success_green'])
-        
-        style.configure('Error.TLabel', 
-                       font=('Segoe UI', 11, 'bold'), 
-                       background=self.colors['background'], 
-                       foreground=self.colors['error_red'])
-        
-        # Interactive button styles
-        style.configure('Predict.TButton', 
-                       font=('Segoe UI', 12, 'bold'), 
-                       padding=(25, 12),
-                       background=self.colors['primary_blue'],
-                       foreground='white')
-        
-        style.map('Predict.TButton',
-                 background=[('active', self.colors['light_blue']),
-                           ('pressed', self.colors['accent_blue'])])
+        self.root.configure(bg=colors['background'])
         
-        style.configure('Action.TButton', 
-                       font=('Segoe UI', 10, 'bold'), 
-                       padding=(15, 8),
-                       background=self.colors['accent_blue'],
-                       foreground='white')
+        # ttk styles belong to the Tk interpreter; configure each root only once
+        if self.root in _STYLED_ROOTS:
+            return
+        _STYLED_ROOTS.add(self.root)
         
-        style.map('Action.TButton',
-                 background=[('active', self.colors['warning_orange']),
-                           ('pressed', self.colors['primary_blue'])])
+        style = ttk.Style(self.root)
+        style.theme_use('clam')
         
-        # Card-like frame styles
-        style.configure('Card.TLabelFrame', 
-                       background=self.colors['card_bg'],
-                       borderwidth=2,
-                       relief='raised')
+        styles = (
+            # Title styles with gradient effect
+            ('Title.TLabel', dict(font=('Segoe UI', 20, 'bold'), background=colors['background'],
+                                  foreground=colors['primary_blue'])),
+            ('Subtitle.TLabel', dict(font=('Segoe UI', 12, 'bold'), background=colors['card_bg'],
+                                     foreground=colors['text_dark'])),
+            ('Info.TLabel', dict(font=('Segoe UI', 10), background=colors['card_bg'],
+                                 foreground=colors['text_light'])),
+            ('Success.TLabel', dict(font=('Segoe UI', 11, 'bold'), background=colors['background'],
+                                    foreground=colors['success_green'])),
+            ('Error.TLabel', dict(font=('Segoe UI', 11, 'bold'), background=colors['background'],
+                                  foreground=colors['error_red'])),
+            
+            # Interactive button styles
+            ('Predict.TButton', dict(font=('Segoe UI', 12, 'bold'), padding=(25, 12),
+                                     background=colors['primary_blue'], foreground='white')),
+            ('Action.TButton', dict(font=('Segoe UI', 10, 'bold'), padding=(15, 8),
+                                    background=colors['accent_blue'], foreground='white')),
+            
+            # Card-like frame styles
+            ('Card.TLabelFrame', dict(background=colors['card_bg'], borderwidth=2, relief='raised')),
+            ('Card.TLabelFrame.Label', dict(font=('Segoe UI', 12, 'bold'), background=colors['card_bg'],
+                                            foreground=colors['primary_blue'])),
+        )
+        for name, options in styles:
+            style.configure(name, **options)
         
-        style.configure('Card.TLabelFrame.Label', 
-                       font=('Segoe UI', 12, 'bold'),
-                       background=self.colors['card_bg'],
-                       foreground=self.colors['primary_blue'])
+        # Button hover and press colors
+        style.map('Predict.TButton',
+                 background=[('active', colors['light_blue']),
+                           ('pressed', colors['accent_blue'])])
+        style.map('Action.TButton',
+                 background=[('active', colors['warning_orange']),
+                           ('pressed', colors['primary_blue'])])
+        
+        # Colored action buttons: (style, normal color, hover color)
+        for name, normal, hover in (
+            ('Clear.TButton', colors['accent_blue'], colors['warning_orange']),
+            ('Save.TButton', colors['success_green'], '#27ae60'),
+            ('View.TButton', '#3498db', '#2980b9'),
+            ('Export.TButton', '#9b59b6', '#8e44ad'),
+            ('Retrain.TButton', '#e67e22', '#d35400'),
+        ):
+            style.configure(name, font=('Segoe UI', 10, 'bold'), padding=(15, 8),
+                            background=normal, foreground='white')
+            style.map(name, background=[('active', hover)])
+        
+        # One spinbox style per input field color
+        for *_, color in FEATURES:
+            style.configure(f'Field.{color[1:]}.TSpinbox', bordercolor=color, arrowcolor=color)
         
     def create_main_interface(self):
         """Create the main application interface with colorful cards"""
@@ -132,10 +266,18 @@ class HeartDiseaseApp:
         scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg=self.colors['background'])
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Recompute the scroll region at most once per idle cycle
+        pending = {'id': None}
+        
+        def update_scrollregion():
+            pending['id'] = None
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        def on_configure(event):
+            if pending['id'] is None:
+                pending['id'] = self.root.after_idle(update_scrollregion)
+        
+        scrollable_frame.bind("<Configure>", on_configure)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -144,155 +286,21 @@ class HeartDiseaseApp:
         scrollbar.pack(side="right", fill="y")
         
         # Header section with animated elements
-        self.create_animated_header(scrollable_frame)
+        self.create_header(scrollable_frame)
         
         # Input section with card design
-        self.create_card_input_section(scrollable_frame)
+        self.create_input_section(scrollable_frame)
         
         # Interactive action buttons
-        self.create_interactive_buttons(scrollable_frame)
+        self.create_action_buttons(scrollable_frame)
         
         # Results section with graphics
-        self.create_visual_results_section(scrollable_frame)
+        self.create_results_section(scrollable_frame)
         
         # Data management with charts
-        self.create_enhanced_data_section(scrollable_frame)
+        self.create_data_section(scrollable_frame)
         
     def create_header(self, parent):
-        """Create header section"""
-        header_frame = ttk.Frame(parent)
-        header_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 20))
-        
-        # Title
-        title_label = ttk.Label(header_frame, text="🏥 Heart Disease Risk Assessment System", 
-                               style='Title.TLabel')
-        title_label.grid(row=0, column=0, sticky=tk.W)
-        
-        # Status
-        self.status_label = ttk.Label(header_frame, text="🔄 Loading model...", 
-                                     style='Info.TLabel')
-        self.status_label.grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
-        
-        # Model info
-        self.model_info_label = ttk.Label(header_frame, text="", style='Success.TLabel')
-        self.model_info_label.grid(row=2, column=0, sticky=tk.W, pady=(2, 0))
-        
-    def create_input_section(self, parent):
-        """Create input fields section"""
-        # Input frame with border
-        input_frame = ttk.LabelFrame(parent, text="📋 Patient Information", padding="15")
-        input_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
-        input_frame.columnconfigure(1, weight=1)
-        input_frame.columnconfigure(3, weight=1)
-        
-        self.input_vars = {}
-        
-        # Feature definitions
-        features = [
-            ('age', 'Age (years)', 'Patient age', 1, 120, 0),
-            ('sex', 'Sex', '0=Female, 1=Male', 0, 1, 1),
-            ('cp', 'Chest Pain Type', '0=Typical, 1=Atypical, 2=Non-anginal, 3=Asymptomatic', 0, 3, 2),
-            ('trestbps', 'Resting BP (mmHg)', 'Resting blood pressure', 50, 300, 3),
-            ('chol', 'Cholesterol (mg/dl)', 'Serum cholesterol level', 100, 600, 4),
-            ('fbs', 'Fasting Blood Sugar', 'FBS > 120 mg/dl (0=No, 1=Yes)', 0, 1, 5),
-            ('restecg', 'Resting ECG', '0=Normal, 1=ST-T abnormal, 2=LV hypertrophy', 0, 2, 6),
-            ('thalach', 'Max Heart Rate', 'Maximum heart rate achieved', 50, 250, 7),
-            ('exang', 'Exercise Angina', 'Exercise induced angina (0=No, 1=Yes)', 0, 1, 8),
-            ('oldpeak', 'ST Depression', 'ST depression by exercise', 0.0, 10.0, 9),
-            ('slope', 'ST Slope', '0=Upsloping, 1=Flat, 2=Downsloping', 0, 2, 10),
-            ('ca', 'Major Vessels', 'Vessels colored by fluoroscopy (0-4)', 0, 4, 11),
-            ('thal', 'Thalassemia', '0=Normal, 1=Fixed, 2=Reversible, 3=Not described', 0, 3, 12)
-        ]
-        
-        # Create input fields in 2 columns
-        for i, (feature, label, description, min_val, max_val, idx) in enumerate(features):
-            row = idx // 2
-            col = (idx % 2) * 2
-            
-            # Label
-            ttk.Label(input_frame, text=f"{label}:", style='Subtitle.TLabel').grid(
-                row=row*2, column=col, sticky=tk.W, padx=(0, 10), pady=2)
-            
-            # Input field
-            if feature == 'oldpeak':
-                self.input_vars[feature] = tk.DoubleVar(value=0.0)
-                entry = ttk.Spinbox(input_frame, from_=min_val, to=max_val, increment=0.1,
-                                   textvariable=self.input_vars[feature], width=15)
-            else:
-                self.input_vars[feature] = tk.IntVar(value=0)
-                entry = ttk.Spinbox(input_frame, from_=min_val, to=max_val, increment=1,
-                                   textvariable=self.input_vars[feature], width=15)
-            
-            entry.grid(row=row*2, column=col+1, sticky=tk.W, padx=(0, 20), pady=2)
-            
-            # Description
-            ttk.Label(input_frame, text=description, style='Info.TLabel').grid(
-                row=row*2+1, column=col, columnspan=2, sticky=tk.W, padx=(0, 20), pady=(0, 10))
-        
-    def create_action_buttons(self, parent):
-        """Create action buttons"""
-        button_frame = ttk.Frame(parent)
-        button_frame.grid(row=2, column=0, columnspan=2, pady=20)
-        
-        # Main predict button
-        self.predict_button = ttk.Button(button_frame, text="🔍 Predict Heart Disease Risk", 
-                                        command=self.predict_risk, style='Predict.TButton',
-                                        state='disabled')
-        self.predict_button.pack(side=tk.LEFT, padx=10)
-        
-        # Clear button
-        clear_button = ttk.Button(button_frame, text="🗑️ Clear All Fields", 
-                                 command=self.clear_fields, style='Action.TButton')
-        clear_button.pack(side=tk.LEFT, padx=10)
-        
-        # Save prediction button
-        self.save_button = ttk.Button(button_frame, text="💾 Save Prediction", 
-                                     command=self.save_prediction, style='Action.TButton',
-                                     state='disabled')
-        self.save_button.pack(side=tk.LEFT, padx=10)
-        
-    def create_results_section(self, parent):
-        """Create results display section"""
-        results_frame = ttk.LabelFrame(parent, text="📊 Prediction Results", padding="15")
-        results_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
-        results_frame.columnconfigure(0, weight=1)
-        
-        # Results display
-        self.results_text = tk.Text(results_frame, height=12, width=80, font=('Consolas', 10),
-                                   wrap=tk.WORD, bg='#ffffff', relief='sunken', bd=2)
-        self.results_text.grid(row=0, column=0, sticky=(tk.W, tk.E))
-        
-        # Scrollbar for results
-        scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.results_text.yview)
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.results_text.configure(yscrollcommand=scrollbar.set)
-        
-        # Initial message
-        self.show_initial_message()
-        
-    def create_data_section(self, parent):
-        """Create data management section"""
-        data_frame = ttk.LabelFrame(parent, text="📁 Data Management", padding="10")
-        data_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
-        
-        # Data info
-        self.data_info_label = ttk.Label(data_frame, text="", style='Info.TLabel')
-        self.data_info_label.grid(row=0, column=0, sticky=tk.W, pady=5)
-        
-        # Data management buttons
-        data_button_frame = ttk.Frame(data_frame)
-        data_button_frame.grid(row=1, column=0, sticky=tk.W, pady=5)
-        
-        ttk.Button(data_button_frame, text="📈 View Saved Predictions", 
-                  command=self.view_saved_data, style='Action.TButton').pack(side=tk.LEFT, padx=5)
-        
-        ttk.Button(data_button_frame, text="📤 Export Data", 
-                  command=self.export_data, style='Action.TButton').pack(side=tk.LEFT, padx=5)
-        
-        ttk.Button(data_button_frame, text="🔄 Retrain Model", 
-                  command=self.retrain_model, style='Action.TButton').pack(side=tk.LEFT, padx=5)
-    
-    def create_animated_header(self, parent):
         """Create animated header with graphics"""
         header_card = tk.Frame(parent, bg=self.colors['card_bg'], relief='raised', bd=3)
         header_card.pack(fill=tk.X, pady=(0, 20), padx=10)
@@ -332,7 +340,7 @@ class HeartDiseaseApp:
                                         bg=self.colors['card_bg'], fg=self.colors['success_green'])
         self.model_info_label.pack(side=tk.RIGHT)
     
-    def create_card_input_section(self, parent):
+    def create_input_section(self, parent):
         """Create input section with card design"""
         input_card = tk.Frame(parent, bg=self.colors['card_bg'], relief='raised', bd=3)
         input_card.pack(fill=tk.X, pady=10, padx=10)
@@ -351,122 +359,64 @@ class HeartDiseaseApp:
         fields_frame = tk.Frame(input_card, bg=self.colors['card_bg'])
         fields_frame.pack(fill=tk.X, padx=20, pady=20)
         
-        self.input_vars = {}
-        
-        # Feature definitions with colors
-        features = [
-            ('age', 'Age (years)', 'Patient age', 1, 120, '#3498db'),
-            ('sex', 'Sex', '0=Female, 1=Male', 0, 1, '#e91e63'),
-            ('cp', 'Chest Pain Type', '0=Typical, 1=Atypical, 2=Non-anginal, 3=Asymptomatic', 0, 3, '#ff9800'),
-            ('trestbps', 'Resting BP (mmHg)', 'Resting blood pressure', 50, 300, '#f44336'),
-            ('chol', 'Cholesterol (mg/dl)', 'Serum cholesterol level', 100, 600, '#9c27b0'),
-            ('fbs', 'Fasting Blood Sugar', 'FBS > 120 mg/dl (0=No, 1=Yes)', 0, 1, '#4caf50'),
-            ('restecg', 'Resting ECG', '0=Normal, 1=ST-T abnormal, 2=LV hypertrophy', 0, 2, '#00bcd4'),
-            ('thalach', 'Max Heart Rate', 'Maximum heart rate achieved', 50, 250, '#ff5722'),
-            ('exang', 'Exercise Angina', 'Exercise induced angina (0=No, 1=Yes)', 0, 1, '#795548'),
-            ('oldpeak', 'ST Depression', 'ST depression by exercise', 0.0, 10.0, '#607d8b'),
-            ('slope', 'ST Slope', '0=Upsloping, 1=Flat, 2=Downsloping', 0, 2, '#8bc34a'),
-            ('ca', 'Major Vessels', 'Vessels colored by fluoroscopy (0-4)', 0, 4, '#ffc107'),
-            ('thal', 'Thalassemia', '0=Normal, 1=Fixed, 2=Reversible, 3=Not described', 0, 3, '#673ab7')
-        ]
-        
-        # Create input fields in a grid with colors
-        for i, (feature, label, description, min_val, max_val, color) in enumerate(features):
-            row = i // 2
+        # Input variables for every feature
+        self.input_vars = {feature: (tk.DoubleVar if feature == 'oldpeak' else tk.IntVar)(value=0)
+                           for feature, *_ in FEATURES}
+        
+        # Values are mirrored into a flat row on every edit so predicting needs no Tcl calls
+        self._row = array.array('d', bytes(8 * len(FEATURES)))
+        self._bad_fields = set()
+        for i, feature in enumerate(FEATURE_ORDER):
+            self.input_vars[feature].trace_add('write', functools.partial(self.update_row, i))
+        
+        # Label, spinbox and description per field, two fields per row
+        for i, (feature, label, description, min_val, max_val, color) in enumerate(FEATURES):
+            row = (i // 2) * 3
             col = i % 2
             
-            # Field container with colored border
-            field_frame = tk.Frame(fields_frame, bg=self.colors['card_bg'], relief='solid', bd=1)
-            field_frame.grid(row=row, column=col, sticky='ew', padx=10, pady=8)
-            fields_frame.grid_columnconfigure(col, weight=1)
-            
-            # Colored indicator
-            indicator = tk.Frame(field_frame, bg=color, width=4)
-            indicator.pack(side=tk.LEFT, fill=tk.Y)
-            
-            # Content frame
-            content_frame = tk.Frame(field_frame, bg=self.colors['card_bg'])
-            content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=8)
-            
-            # Label with color
-            label_widget = tk.Label(content_frame, text=f"{label}:", 
-                                   font=('Segoe UI', 11, 'bold'), 
-                                   bg=self.colors['card_bg'], fg=color)
-            label_widget.pack(anchor='w')
+            tk.Label(fields_frame, text=f"{label}:", font=('Segoe UI', 11, 'bold'),
+                     bg=self.colors['card_bg'], fg=color).grid(
+                row=row, column=col, sticky='w', padx=10, pady=(8, 0))
             
-            # Input field
-            if feature == 'oldpeak':
-                self.input_vars[feature] = tk.DoubleVar(value=0.0)
-                entry = tk.Spinbox(content_frame, from_=min_val, to=max_val, increment=0.1,
-                                  textvariable=self.input_vars[feature], width=15,
-                                  font=('Segoe UI', 10), relief='solid', bd=1)
-            else:
-                self.input_vars[feature] = tk.IntVar(value=0)
-                entry = tk.Spinbox(content_frame, from_=min_val, to=max_val, increment=1,
-                                  textvariable=self.input_vars[feature], width=15,
-                                  font=('Segoe UI', 10), relief='solid', bd=1)
+            ttk.Spinbox(fields_frame, from_=min_val, to=max_val,
+                        increment=0.1 if feature == 'oldpeak' else 1,
+                        textvariable=self.input_vars[feature], width=15,
+                        font=('Segoe UI', 10), style=f'Field.{color[1:]}.TSpinbox').grid(
+                row=row + 1, column=col, sticky='w', padx=10, pady=2)
             
-            entry.pack(anchor='w', pady=2)
-            
-            # Description
-            desc_label = tk.Label(content_frame, text=description, 
-                                 font=('Segoe UI', 9), bg=self.colors['card_bg'], 
-                                 fg=self.colors['text_light'], wraplength=200)
-            desc_label.pack(anchor='w')
+            tk.Label(fields_frame, text=description, font=('Segoe UI', 9),
+                     bg=self.colors['card_bg'], fg=self.colors['text_light'], wraplength=200).grid(
+                row=row + 2, column=col, sticky='w', padx=10)
+        
+        fields_frame.grid_columnconfigure((0, 1), weight=1)
     
-    def create_interactive_buttons(self, parent):
-        """Create interactive action buttons with hover effects"""
+    def create_action_buttons(self, parent):
+        """Create action buttons with hover colors from ttk styles"""
         button_card = tk.Frame(parent, bg=self.colors['card_bg'], relief='raised', bd=3)
         button_card.pack(fill=tk.X, pady=10, padx=10)
         
         button_frame = tk.Frame(button_card, bg=self.colors['card_bg'])
         button_frame.pack(pady=20)
         
-        # Main predict button with gradient effect
-        self.predict_button = tk.Button(button_frame, text="🔍 Predict Heart Disease Risk", 
-                                       command=self.predict_risk, 
-                                       font=('Segoe UI', 12, 'bold'),
-                                       bg=self.colors['primary_blue'], fg='white',
-                                       relief='raised', bd=3, padx=30, pady=12,
-                                       state='disabled', cursor='hand2')
+        # Main predict button
+        self.predict_button = ttk.Button(button_frame, text="🔍 Predict Heart Disease Risk", 
+                                        command=self.predict_risk, style='Predict.TButton',
+                                        state='disabled', cursor='hand2')
         self.predict_button.pack(side=tk.LEFT, padx=15)
         
-        # Bind hover effects
-        self.predict_button.bind('<Enter>', lambda e: self.on_button_hover(e, self.colors['light_blue']))
-        self.predict_button.bind('<Leave>', lambda e: self.on_button_leave(e, self.colors['primary_blue']))
-        
         # Clear button
-        clear_button = tk.Button(button_frame, text="🗑️ Clear All Fields", 
-                                command=self.clear_fields,
-                                font=('Segoe UI', 10, 'bold'),
-                                bg=self.colors['accent_blue'], fg='white',
-                                relief='raised', bd=2, padx=20, pady=8, cursor='hand2')
+        clear_button = ttk.Button(button_frame, text="🗑️ Clear All Fields", 
+                                 command=self.clear_fields, style='Clear.TButton',
+                                 cursor='hand2')
         clear_button.pack(side=tk.LEFT, padx=15)
         
-        clear_button.bind('<Enter>', lambda e: self.on_button_hover(e, self.colors['warning_orange']))
-        clear_button.bind('<Leave>', lambda e: self.on_button_leave(e, self.colors['accent_blue']))
-        
         # Save button
-        self.save_button = tk.Button(button_frame, text="💾 Save Prediction", 
-                                    command=self.save_prediction,
-                                    font=('Segoe UI', 10, 'bold'),
-                                    bg=self.colors['success_green'], fg='white',
-                                    relief='raised', bd=2, padx=20, pady=8,
-                                    state='disabled', cursor='hand2')
+        self.save_button = ttk.Button(button_frame, text="💾 Save Prediction", 
+                                     command=self.save_prediction, style='Save.TButton',
+                                     state='disabled', cursor='hand2')
         self.save_button.pack(side=tk.LEFT, padx=15)
-        
-        self.save_button.bind('<Enter>', lambda e: self.on_button_hover(e, '#27ae60'))
-        self.save_button.bind('<Leave>', lambda e: self.on_button_leave(e, self.colors['success_green']))
-    
-    def on_button_hover(self, event, color):
-        """Button hover effect"""
-        event.widget.config(bg=color)
     
-    def on_button_leave(self, event, color):
-        """Button leave effect"""
-        event.widget.config(bg=color)
-    
-    def create_visual_results_section(self, parent):
+    def create_results_section(self, parent):
         """Create results section with visual elements"""
         results_card = tk.Frame(parent, bg=self.colors['card_bg'], relief='raised', bd=3)
         results_card.pack(fill=tk.X, pady=10, padx=10)
@@ -513,7 +463,7 @@ class HeartDiseaseApp:
         # Initial styled message
         self.show_styled_initial_message()
     
-    def create_enhanced_data_section(self, parent):
+    def create_data_section(self, parent):
         """Create enhanced data management section with visual elements"""
         data_card = tk.Frame(parent, bg=self.colors['card_bg'], relief='raised', bd=3)
         data_card.pack(fill=tk.X, pady=10, padx=10)
@@ -558,141 +508,255 @@ class HeartDiseaseApp:
                                       fg=self.colors['success_green'])
         self.accuracy_label.pack(side=tk.LEFT, padx=5)
         
+        # Prediction cache hits
+        self.cache_frame = tk.Frame(stats_frame, bg='#fdf2e9', relief='solid', bd=1)
+        self.cache_frame.pack(side=tk.LEFT, padx=10, pady=5)
+        
+        tk.Label(self.cache_frame, text="⚡", font=('Arial', 16), 
+                bg='#fdf2e9').pack(side=tk.LEFT, padx=5)
+        self.cache_label = tk.Label(self.cache_frame, text="Cache hits: 0", 
+                                   font=('Segoe UI', 10, 'bold'), bg='#fdf2e9', 
+                                   fg=self.colors['text_dark'])
+        self.cache_label.pack(side=tk.LEFT, padx=5)
+        
         # Action buttons with enhanced styling
         button_frame = tk.Frame(info_frame, bg=self.colors['card_bg'])
         button_frame.pack(fill=tk.X, pady=15)
         
         # View data button
-        view_btn = tk.Button(button_frame, text="📈 View Saved Predictions", 
-                            command=self.view_saved_data,
-                            font=('Segoe UI', 10, 'bold'),
-                            bg='#3498db', fg='white', relief='raised', bd=2,
-                            padx=15, pady=8, cursor='hand2')
-        view_btn.pack(side=tk.LEFT, padx=5)
-        view_btn.bind('<Enter>', lambda e: self.on_button_hover(e, '#2980b9'))
-        view_btn.bind('<Leave>', lambda e: self.on_button_leave(e, '#3498db'))
+        ttk.Button(button_frame, text="📈 View Saved Predictions", 
+                  command=self.view_saved_data, style='View.TButton',
+                  cursor='hand2').pack(side=tk.LEFT, padx=5)
         
         # Export button
-        export_btn = tk.Button(button_frame, text="📤 Export Data", 
-                              command=self.export_data,
-                              font=('Segoe UI', 10, 'bold'),
-                              bg='#9b59b6', fg='white', relief='raised', bd=2,
-                              padx=15, pady=8, cursor='hand2')
-        export_btn.pack(side=tk.LEFT, padx=5)
-        export_btn.bind('<Enter>', lambda e: self.on_button_hover(e, '#8e44ad'))
-        export_btn.bind('<Leave>', lambda e: self.on_button_leave(e, '#9b59b6'))
+        ttk.Button(button_frame, text="📤 Export Data", 
+                  command=self.export_data, style='Export.TButton',
+                  cursor='hand2').pack(side=tk.LEFT, padx=5)
         
         # Retrain button
-        retrain_btn = tk.Button(button_frame, text="🔄 Retrain Model", 
-                               command=self.retrain_model,
-                               font=('Segoe UI', 10, 'bold'),
-                               bg='#e67e22', fg='white', relief='raised', bd=2,
-                               padx=15, pady=8, cursor='hand2')
-        retrain_btn.pack(side=tk.LEFT, padx=5)
-        retrain_btn.bind('<Enter>', lambda e: self.on_button_hover(e, '#d35400'))
-        retrain_btn.bind('<Leave>', lambda e: self.on_button_leave(e, '#e67e22'))
+        ttk.Button(button_frame, text="🔄 Retrain Model", 
+                  command=self.retrain_model, style='Retrain.TButton',
+                  cursor='hand2').pack(side=tk.LEFT, padx=5)
     
     def show_styled_initial_message(self):
         """Show styled initial message in results area"""
         self.results_text.delete(1.0, tk.END)
         
-        # Welcome header
-        self.results_text.insert(tk.END, "🏥 Heart Disease Risk Assessment System\n\n", 'header')
-        
-        # Instructions
-        self.results_text.insert(tk.END, "Welcome to the Professional Medical Risk Assessment Tool\n\n")
-        self.results_text.insert(tk.END, "📋 Instructions:\n", 'info')
-        self.results_text.insert(tk.END, "1. Fill in all patient information fields above\n")
-        self.results_text.insert(tk.END, "2. Click 'Predict Heart Disease Risk' to get assessment\n")
-        self.results_text.insert(tk.END, "3. Review the detailed risk analysis and recommendations\n")
-        self.results_text.insert(tk.END, "4. Save predictions for future reference and analysis\n\n")
-        
-        # Features
-        self.results_text.insert(tk.END, "✨ Key Features:\n", 'success')
-        self.results_text.insert(tk.END, "• Advanced machine learning risk prediction\n")
-        self.results_text.insert(tk.END, "• Comprehensive patient data management\n")
-        self.results_text.insert(tk.END, "• Visual risk level interpretation\n")
-        self.results_text.insert(tk.END, "• Data export and analysis capabilities\n")
-        self.results_text.insert(tk.END, "• Continuous model improvement\n\n")
-        
-        # Medical disclaimer
-        self.results_text.insert(tk.END, "⚠️  IMPORTANT MEDICAL DISCLAIMER:\n", 'warning')
-        self.results_text.insert(tk.END, "This tool is designed for educational and research purposes only.\n", 'info')
-        self.results_text.insert(tk.END, "Always consult qualified healthcare professionals for medical advice.\n", 'info')
-        self.results_text.insert(tk.END, "Do not use this tool as a substitute for professional medical diagnosis.\n", 'info')
+        self.insert_text(_STYLED_WELCOME_TEXT, _STYLED_WELCOME_TAGS)
         
         self.results_text.config(state=tk.DISABLED)
         
-    def load_model_async(self):
-        """Load and train model in background"""
-        def load_model():
+    def insert_text(self, text, tags):
+        """Insert text with one call and apply precomputed (tag, start, end) ranges"""
+        self.results_text.insert(tk.END, text)
+        for tag, start, end in tags:
+            self.results_text.tag_add(tag, start, end)
+        
+    def load_model_async(self, new_records=()):
+        """Load cached model or train a new one in background"""
+        if not os.path.exists(self.data_file):
+            self.update_status(f"❌ Error: '{self.data_file}' not found!", 'error')
+            return
+        
+        self.update_status("🤖 Loading model...", 'info')
+        future = self._pool.submit(self._train_model, new_records)
+        self.root.after(100, self._poll_model, future, new_records)
+        
+    def _train_model(self, new_records=()):
+        """Load or train the model (runs in worker thread, no Tk calls)"""
+        # Heavy imports are deferred here so the window appears immediately
+        import joblib
+        import numpy as np
+        import pandas as pd
+        from sklearn.model_selection import train_test_split
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.metrics import accuracy_score
+        
+        if new_records:
+            self.append_main_records(new_records)
+            # Written, so a later failure in this job must not queue them again
+            new_records.clear()
+        
+        # Models are cached per dataset content
+        with open(self.data_file, 'rb') as f:
+            data_hash = hashlib.sha1(f.read()).hexdigest()
+        model_path = f'heart_model_{data_hash}.joblib'
+        cached_info = self.read_cached_info(data_hash)
+        
+        if cached_info and os.path.exists(model_path):
+            try:
+                return joblib.load(model_path), cached_info['accuracy'], cached_info['records']
+            except Exception:
+                pass  # Unreadable cache, retrain below
+        
+        # Load data, reusing the in-memory arrays if the file only grew through us
+        if self._X is None or os.path.getsize(self.data_file) != self._data_size:
+            self._data_size = os.path.getsize(self.data_file)
+            heart_data = pd.read_csv(self.data_file, dtype=DTYPES, engine='c', usecols=list(DTYPES))
+            self._X = heart_data[list(FEATURE_ORDER)].to_numpy(dtype=np.float64)
+            self._y = heart_data['target'].to_numpy(dtype=np.int8)
+            del heart_data
+        X, y = self._X, self._y
+        n_records = len(y)
+        
+        # Train model
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, stratify=y, random_state=42)
+        # liblinear converges in a few iterations on this small dataset
+        # (same L2-penalized objective, except the intercept is also penalized)
+        model = LogisticRegression(solver='liblinear', C=1.0, tol=1e-4, max_iter=200,
+                                   dual=False, random_state=42)
+        model.fit(X_train, y_train)
+        
+        # Calculate accuracy with the same decision rule the app predicts with
+        test_predictions = logistic_scores(X_test, model.coef_[0], model.intercept_[0]) >= 0.5
+        accuracy = accuracy_score(y_test, test_predictions)
+        
+        # Cache model for next launch, writing to temp files then renaming
+        # so a half-written cache is never picked up
+        with self._cache_lock:
             try:
-                self.root.after(0, lambda: self.update_status("📊 Loading dataset...", 'info'))
-                
-                if not os.path.exists(self.data_file):
-                    self.root.after(0, lambda: self.update_status(f"❌ Error: '{self.data_file}' not found!", 'error'))
-                    return
-                
-                # Load data
-                heart_data = pd.read_csv(self.data_file)
-                X = heart_data.drop(columns='target', axis=1)
-                y = heart_data['target']
-                
-                self.root.after(0, lambda: self.update_status("🤖 Training model...", 'info'))
-                
-                # Train model
-                X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, stratify=y, random_state=42)
-                self.model = LogisticRegression(random_state=42, max_iter=1000)
-                self.model.fit(X_train, y_train)
-                
-                # Calculate accuracy
-                test_predictions = self.model.predict(X_test)
-                accuracy = accuracy_score(y_test, test_predictions)
-                
-                # Update UI
-                self.root.after(0, lambda: self.update_status("✅ Model ready!", 'success'))
-                self.root.after(0, lambda: self.model_info_label.config(text=f"Model Accuracy: {accuracy:.1%} | Dataset: {len(heart_data)} records"))
-                self.root.after(0, lambda: self.predict_button.config(state='normal'))
-                self.root.after(0, self.update_data_info)
-                
-            except Exception as e:
-                self.root.after(0, lambda: self.update_status(f"❌ Error: {str(e)}", 'error'))
-        
-        threading.Thread(target=load_model, daemon=True).start()
+                self.clear_model_cache()
+                joblib.dump(model, model_path + '.tmp', compress=3)
+                with open(self.accuracy_file + '.tmp', 'wb') as f:
+                    f.write(json_dumps({'hash': data_hash, 'accuracy': float(accuracy), 'records': n_records}))
+                os.replace(model_path + '.tmp', model_path)
+                os.replace(self.accuracy_file + '.tmp', self.accuracy_file)
+            except OSError:
+                # Caching is best effort; drop partial files and keep the fitted model
+                for path in (model_path + '.tmp', self.accuracy_file + '.tmp'):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+        
+        return model, accuracy, n_records
+        
+    def _poll_model(self, future, new_records=()):
+        """Install the model on the main thread once the worker is done"""
+        if not future.done():
+            self.root.after(100, self._poll_model, future, new_records)
+            return
+        
+        try:
+            model, accuracy, n_records = future.result()
+        except Exception as e:
+            # Records the job did not write stay pending for the next retrain or exit flush
+            self._pending_main_records[:0] = new_records
+            self.update_status(f"❌ Error: {str(e)}", 'error')
+            return
+        
+        import numpy as np
+        
+        self.model = model
+        # Plain weights and a reused input row for fast single-sample scoring
+        self._w = model.coef_[0].astype(np.float64)
+        self._x_buf = np.empty(len(FEATURE_ORDER), dtype=np.float64)
+        self._b = float(model.intercept_[0])
+        self._warm = None
+        # Input bounds in model order for vectorized validation
+        bounds = np.array([(min_val, max_val) for _, _, _, min_val, max_val, _ in FEATURES], dtype=np.float64)
+        # Stored as centre and half-width so one compare checks both ends
+        self._mid = bounds.mean(axis=1)
+        self._half = (bounds[:, 1] - bounds[:, 0]) / 2
+        # Fresh cache per model so retraining invalidates old scores
+        self.score = functools.lru_cache(maxsize=256)(self._score)
+        
+        # Update UI
+        self.update_status("✅ Model ready!", 'success')
+        self.model_info_label.config(text=f"Model Accuracy: {accuracy:.1%} | Dataset: {n_records} records")
+        self.accuracy_label.config(text=f"Model Accuracy: {accuracy:.1%}")
+        self.predict_button.config(state='normal')
+        self.update_data_info()
+        
+    def run_io(self, func, on_done, error_title, error_message, on_error=None):
+        """Run file I/O on the I/O worker and hand the result to on_done on the main thread"""
+        # on_error, if given, also runs on the main thread, after a failed job's error dialog
+        future = self._io_pool.submit(func)
+        self.root.after(50, self._poll_io, future, on_done, error_title, error_message, on_error)
+        
+    def _poll_io(self, future, on_done, error_title, error_message, on_error=None):
+        """Wait for an I/O job without blocking the Tk event loop"""
+        if not future.done():
+            self.root.after(50, self._poll_io, future, on_done, error_title, error_message, on_error)
+            return
+        
+        try:
+            result = future.result()
+        except Exception as e:
+            messagebox.showerror(error_title, f"{error_message}: {str(e)}")
+            if on_error:
+                on_error()
+            return
+        on_done(result)
+        
+    def read_cached_info(self, data_hash):
+        """Return cached accuracy info if it matches the dataset hash"""
+        try:
+            with open(self.accuracy_file, 'rb') as f:
+                info = json_loads(f.read())
+            return info if info.get('hash') == data_hash else None
+        except (OSError, ValueError):
+            return None
+            
+    def clear_model_cache(self):
+        """Delete cached model files"""
+        with self._cache_lock:
+            for path in glob.glob('heart_model_*.joblib') + [self.accuracy_file]:
+                if os.path.exists(path):
+                    os.remove(path)
         
     def update_status(self, message, status_type):
         """Update status label"""
         colors = {'info': '#3498db', 'success': '#27ae60', 'error': '#e74c3c'}
         self.status_label.config(text=message, foreground=colors.get(status_type, '#7f8c8d'))
         
+    def count_saved_predictions(self):
+        """Count saved prediction rows with a fast line count"""
+        if not os.path.exists(self.user_data_file):
+            return 0
+        with open(self.user_data_file, 'rb') as f:
+            return max(sum(1 for _ in f) - 1, 0)
+            
     def update_data_info(self):
         """Update data management info"""
-        try:
-            if os.path.exists(self.user_data_file):
-                user_data = pd.read_csv(self.user_data_file)
-                self.data_info_label.config(text=f"Saved predictions: {len(user_data)} records")
-            else:
-                self.data_info_label.config(text="No saved predictions yet")
-        except:
-            self.data_info_label.config(text="Error reading saved data")
+        if self._saved_n:
+            self.data_info_label.config(text=f"Saved predictions: {self._saved_n} records")
+        else:
+            self.data_info_label.config(text="No saved predictions yet")
             
-    def validate_inputs(self):
-        """Validate all inputs"""
+    def _score(self, features):
+        """Risk probability for a feature tuple, bypassing sklearn dispatch"""
+        from scipy.special import expit
+        
+        self._x_buf[:] = features
+        return float(expit(self._x_buf @ self._w + self._b))
+        
+    def update_row(self, i, *_):
+        """Copy an edited field into the input row"""
         try:
-            ranges = {
-                'age': (1, 120), 'sex': (0, 1), 'cp': (0, 3), 'trestbps': (50, 300),
-                'chol': (100, 600), 'fbs': (0, 1), 'restecg': (0, 2), 'thalach': (50, 250),
-                'exang': (0, 1), 'oldpeak': (0, 10), 'slope': (0, 2), 'ca': (0, 4), 'thal': (0, 3)
-            }
+            self._row[i] = self.input_vars[FEATURE_ORDER[i]].get()
+            self._bad_fields.discard(i)
+        except tk.TclError:
+            self._bad_fields.add(i)
             
-            for feature, (min_val, max_val) in ranges.items():
-                value = self.input_vars[feature].get()
-                if not (min_val <= value <= max_val):
-                    raise ValueError(f"{feature.title()} must be between {min_val} and {max_val}")
-            return True
-        except ValueError as e:
-            messagebox.showerror("Input Error", str(e))
-            return False
+    def validate_inputs(self):
+        """Validate all inputs, returning them in model order (None if invalid)"""
+        import numpy as np
+        
+        if self._bad_fields:
+            messagebox.showerror("Input Error", "Please enter numeric values in all fields")
+            return None
+        
+        # Check all ranges at once
+        values = np.frombuffer(self._row, dtype=np.float64)
+        # Written as "not within" so NaN also counts as out of range
+        bad = np.flatnonzero(~(np.abs(values - self._mid) <= self._half))
+        if bad.size:
+            feature, _, _, min_val, max_val, _ = FEATURES[bad[0]]
+            messagebox.showerror("Input Error", f"{feature.title()} must be between {min_val} and {max_val}")
+            return None
+        return [value if feature == 'oldpeak' else int(value)
+                for feature, value in zip(FEATURE_ORDER, self._row)]
             
     def predict_risk(self):
         """Make prediction"""
@@ -700,20 +764,15 @@ class HeartDiseaseApp:
             messagebox.showerror("Error", "Model not ready yet")
             return
             
-        if not self.validate_inputs():
+        input_data = self.validate_inputs()
+        if input_data is None:
             return
             
         try:
-            # Get input data
-            feature_order = ['age', 'sex', 'cp', 'trestbps', 'chol', 'fbs', 'restecg', 
-                           'thalach', 'exang', 'oldpeak', 'slope', 'ca', 'thal']
-            
-            input_data = [self.input_vars[feature].get() for feature in feature_order]
-            input_array = np.array(input_data).reshape(1, -1)
-            
-            # Make prediction
-            prediction = self.model.predict(input_array)[0]
-            probability = self.model.predict_proba(input_array)[0]
+            p = self.score(tuple(input_data))
+            probability = (1.0 - p, p)
+            self.cache_label.config(text=f"Cache hits: {self.score.cache_info().hits}")
+            prediction = int(p >= 0.5)
             
             # Store current prediction
             self.current_prediction = {
@@ -732,29 +791,14 @@ class HeartDiseaseApp:
             
     def display_results(self, prediction, probability, input_data):
         """Display prediction results"""
-        self.results_text.delete(1.0, tk.END)
-        
-        # Header
-        self.results_text.insert(tk.END, "=" * 70 + "\n")
-        self.results_text.insert(tk.END, "🏥 HEART DISEASE RISK ASSESSMENT RESULTS\n")
-        self.results_text.insert(tk.END, "=" * 70 + "\n\n")
-        
-        # Timestamp
-        self.results_text.insert(tk.END, f"📅 Assessment Date: {self.current_prediction['timestamp']}\n\n")
-        
-        # Main result
         risk_score = probability[1] * 100
-        confidence = max(probability) * 100
+        confidence = probability[prediction] * 100
         
+        # Main result
         if prediction == 0:
-            self.results_text.insert(tk.END, "✅ RESULT: LOW RISK\n")
-            self.results_text.insert(tk.END, f"   The model indicates LOW risk of heart disease\n")
+            result = "✅ RESULT: LOW RISK\n   The model indicates LOW risk of heart disease\n"
         else:
-            self.results_text.insert(tk.END, "⚠️  RESULT: HIGH RISK\n")
-            self.results_text.insert(tk.END, f"   The model indicates HIGH risk of heart disease\n")
-            
-        self.results_text.insert(tk.END, f"   Confidence Level: {confidence:.1f}%\n")
-        self.results_text.insert(tk.END, f"   Risk Score: {risk_score:.1f}%\n\n")
+            result = "⚠️  RESULT: HIGH RISK\n   The model indicates HIGH risk of heart disease\n"
         
         # Risk level interpretation
         if risk_score < 25:
@@ -765,26 +809,30 @@ class HeartDiseaseApp:
             level = "🟠 Moderate Risk"
         else:
             level = "🔴 High Risk"
-            
-        self.results_text.insert(tk.END, f"📊 Risk Level: {level}\n\n")
-        
-        # Input summary
-        self.results_text.insert(tk.END, "📋 Input Summary:\n")
-        self.results_text.insert(tk.END, "-" * 30 + "\n")
         
         feature_names = ['Age', 'Sex', 'Chest Pain', 'Resting BP', 'Cholesterol', 'Fasting BS',
                         'Resting ECG', 'Max HR', 'Exercise Angina', 'ST Depression', 'ST Slope',
                         'Major Vessels', 'Thalassemia']
+        summary = ''.join(f"   • {name}: {value}\n" for name, value in zip(feature_names, input_data))
         
-        for i, (name, value) in enumerate(zip(feature_names, input_data)):
-            self.results_text.insert(tk.END, f"   • {name}: {value}\n")
-            
-        # Disclaimer
-        self.results_text.insert(tk.END, f"\n{'='*70}\n")
-        self.results_text.insert(tk.END, "⚠️  MEDICAL DISCLAIMER:\n")
-        self.results_text.insert(tk.END, "This prediction is for educational purposes only.\n")
-        self.results_text.insert(tk.END, "Always consult healthcare professionals for medical advice.\n")
-        self.results_text.insert(tk.END, "=" * 70 + "\n")
+        # Build the whole report and insert it at once
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END,
+            "=" * 70 + "\n"
+            "🏥 HEART DISEASE RISK ASSESSMENT RESULTS\n"
+            + "=" * 70 + "\n\n"
+            f"📅 Assessment Date: {self.current_prediction['timestamp']}\n\n"
+            + result +
+            f"   Confidence Level: {confidence:.1f}%\n"
+            f"   Risk Score: {risk_score:.1f}%\n\n"
+            f"📊 Risk Level: {level}\n\n"
+            "📋 Input Summary:\n"
+            + "-" * 30 + "\n"
+            + summary +
+            f"\n{'='*70}\n"
+            + _DISCLAIMER_TEXT)
+        self.results_text.config(state=tk.DISABLED)
         
     def save_prediction(self):
         """Save current prediction to dataset"""
@@ -792,45 +840,81 @@ class HeartDiseaseApp:
             messagebox.showwarning("Warning", "No prediction to save")
             return
             
-        try:
-            # Prepare data for saving
-            feature_names = ['age', 'sex', 'cp', 'trestbps', 'chol', 'fbs', 'restecg', 
-                           'thalach', 'exang', 'oldpeak', 'slope', 'ca', 'thal']
+        # Prepare data for saving
+        new_record = dict(zip(FEATURE_ORDER, self.current_prediction['input_data']))
+        new_record['target'] = self.current_prediction['prediction']
+        new_record['risk_score'] = self.current_prediction['probability'][1] * 100
+        new_record['confidence'] = self.current_prediction['probability'][self.current_prediction['prediction']] * 100
+        new_record['timestamp'] = self.current_prediction['timestamp']
+        
+        self.save_button.config(state='disabled')
+        self.run_io(lambda: self._append_user_record(new_record),
+                    lambda _: self._on_prediction_saved(new_record),
+                    "Save Error", "Error saving prediction",
+                    on_error=lambda: self.save_button.config(state='normal'))
+        
+    def _append_user_record(self, record):
+        """Append a record to the user data file (runs in I/O worker)"""
+        # Write the header for a new or empty file
+        with open(self.user_data_file, 'a', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+            if f.tell() == 0:
+                writer.writeheader()
+            writer.writerow(record)
             
-            new_record = {}
-            for i, feature in enumerate(feature_names):
-                new_record[feature] = self.current_prediction['input_data'][i]
+    def append_main_records(self, records):
+        """Append records to the main dataset and the in-memory training arrays"""
+        rows = [[record[column] for column in FEATURE_ORDER + ('target',)] for record in records]
+        with open(self.data_file, 'a', newline='') as f:
+            start = f.tell()
+            csv.writer(f).writerows(rows)
+            end = f.tell()
             
-            new_record['target'] = self.current_prediction['prediction']
-            new_record['risk_score'] = self.current_prediction['probability'][1] * 100
-            new_record['confidence'] = max(self.current_prediction['probability']) * 100
-            new_record['timestamp'] = self.current_prediction['timestamp']
+        if self._X is not None and start == self._data_size:
+            import numpy as np
+            new_rows = np.array(rows, dtype=np.float64)
+            # Round through the file dtypes so rows match a fresh read
+            for i, column in enumerate(FEATURE_ORDER):
+                new_rows[:, i] = new_rows[:, i].astype(DTYPES[column])
+            self._X = np.vstack([self._X, new_rows[:, :-1]])
+            self._y = np.concatenate([self._y, new_rows[:, -1].astype(np.int8)])
+            self._data_size = end
             
-            # Save to user data file
-            if os.path.exists(self.user_data_file):
-                user_df = pd.read_csv(self.user_data_file)
-                user_df = pd.concat([user_df, pd.DataFrame([new_record])], ignore_index=True)
-            else:
-                user_df = pd.DataFrame([new_record])
-                
-            user_df.to_csv(self.user_data_file, index=False)
+    def flush_pending_records(self):
+        """Append all pending consented records to the main dataset"""
+        if self._pending_main_records:
+            self.append_main_records(self._pending_main_records)
+            self._pending_main_records.clear()
+        
+    def _on_prediction_saved(self, new_record):
+        """Finish saving once the user data file has been written"""
+        self._saved_n += 1
+        self.update_data_info()
+        
+        # Also add to main dataset (optional - ask user)
+        result = messagebox.askyesno("Add to Training Data", 
+                                   "Would you like to add this record to the main training dataset?")
+        if result:
+            self._pending_main_records.append(new_record)
+            self.warm_update(new_record)
+        messagebox.showinfo("Success", "Prediction saved successfully!")
+        
+        if len(self._pending_main_records) >= REFIT_AFTER:
+            self.start_retrain()
             
-            # Also add to main dataset (optional - ask user)
-            result = messagebox.askyesno("Add to Training Data", 
-                                       "Would you like to add this record to the main training dataset?")
-            if result:
-                main_df = pd.read_csv(self.data_file)
-                main_record = {feature: new_record[feature] for feature in feature_names}
-                main_record['target'] = new_record['target']
-                main_df = pd.concat([main_df, pd.DataFrame([main_record])], ignore_index=True)
-                main_df.to_csv(self.data_file, index=False)
-                
-            messagebox.showinfo("Success", "Prediction saved successfully!")
-            self.update_data_info()
-            self.save_button.config(state='disabled')
+    def warm_update(self, record):
+        """Nudge the deployed weights toward a newly added record"""
+        import numpy as np
+        import heart_model
+        
+        if self._warm is None:
+            self._warm = heart_model.warm_start_sgd(self.model)
             
-        except Exception as e:
-            messagebox.showerror("Save Error", f"Error saving prediction: {str(e)}")
+        x = np.array([[record[column] for column in FEATURE_ORDER]], dtype=np.float64)
+        self._warm.partial_fit(x, [record['target']], classes=np.array([0, 1]))
+        self._w = self._warm.coef_[0].copy()
+        self._b = float(self._warm.intercept_[0])
+        self.score.cache_clear()
             
     def clear_fields(self):
         """Clear all input fields"""
@@ -841,80 +925,91 @@ class HeartDiseaseApp:
         
     def show_initial_message(self):
         """Show initial message in results area"""
+        self.results_text.config(state=tk.NORMAL)
         self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, "🏥 Heart Disease Risk Assessment System\n\n")
-        self.results_text.insert(tk.END, "Enter patient information above and click 'Predict Heart Disease Risk' to get results.\n\n")
-        self.results_text.insert(tk.END, "Features:\n")
-        self.results_text.insert(tk.END, "• Professional medical risk assessment\n")
-        self.results_text.insert(tk.END, "• Save predictions for future reference\n")
-        self.results_text.insert(tk.END, "• Export data for analysis\n")
-        self.results_text.insert(tk.END, "• Continuous model improvement\n\n")
-        self.results_text.insert(tk.END, "⚠️  This tool is for educational purposes only.\n")
-        self.results_text.insert(tk.END, "Always consult healthcare professionals for medical advice.")
+        self.results_text.insert(tk.END, _WELCOME_TEXT)
+        self.results_text.config(state=tk.DISABLED)
         
     def view_saved_data(self):
         """View saved predictions"""
-        try:
-            if not os.path.exists(self.user_data_file):
-                messagebox.showinfo("No Data", "No saved predictions found")
-                return
-                
-            user_data = pd.read_csv(self.user_data_file)
-            
-            # Create new window to display data
-            data_window = tk.Toplevel(self.root)
-            data_window.title("Saved Predictions")
-            data_window.geometry("800x600")
-            
-            # Create treeview for data display
-            tree_frame = ttk.Frame(data_window, padding="10")
-            tree_frame.pack(fill=tk.BOTH, expand=True)
+        if not os.path.exists(self.user_data_file):
+            messagebox.showinfo("No Data", "No saved predictions found")
+            return
             
-            tree = ttk.Treeview(tree_frame)
-            tree.pack(fill=tk.BOTH, expand=True)
+        # Weights as of now, in case a retrain lands while reading
+        model = (self._w, self._b) if self.model else None
+        
+        def read():
+            import numpy as np
+            import pandas as pd
+            user_data = pd.read_csv(self.user_data_file, dtype=SAVED_DTYPES, engine='c',
+                                    usecols=list(FIELDNAMES))
             
-            # Configure columns
-            tree['columns'] = list(user_data.columns)
-            tree['show'] = 'headings'
+            # Rescore every saved row with the current model in one call
+            if model:
+                X = user_data[list(FEATURE_ORDER)].to_numpy(dtype=np.float64)
+                user_data['current_risk'] = (logistic_scores(X, *model) * 100).round(1)
+            return user_data
             
-            for col in user_data.columns:
-                tree.heading(col, text=col)
-                tree.column(col, width=80)
-                
-            # Insert data
-            for _, row in user_data.iterrows():
-                tree.insert('', tk.END, values=list(row))
-                
-        except Exception as e:
-            messagebox.showerror("Error", f"Error viewing data: {str(e)}")
+        self.run_io(read, self.show_saved_data, "Error", "Error viewing data")
+        
+    def show_saved_data(self, user_data):
+        """Display saved predictions in a new window"""
+        # Create new window to display data
+        data_window = tk.Toplevel(self.root)
+        data_window.title("Saved Predictions")
+        data_window.geometry("800x600")
+        
+        # Create treeview for data display
+        tree_frame = ttk.Frame(data_window, padding="10")
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        
+        tree = ttk.Treeview(tree_frame)
+        
+        # Configure columns
+        tree['columns'] = list(user_data.columns)
+        tree['show'] = 'headings'
+        
+        for col in user_data.columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=80)
             
+        # Insert data before mapping the tree so rows don't redraw one by one
+        for row in user_data.itertuples(index=False, name=None):
+            tree.insert('', tk.END, values=row)
+        tree.pack(fill=tk.BOTH, expand=True)
+        
     def export_data(self):
         """Export saved data"""
-        try:
-            if not os.path.exists(self.user_data_file):
-                messagebox.showinfo("No Data", "No data to export")
-                return
-                
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
-            )
+        if not os.path.exists(self.user_data_file):
+            messagebox.showinfo("No Data", "No data to export")
+            return
             
-            if filename:
-                user_data = pd.read_csv(self.user_data_file)
-                user_data.to_csv(filename, index=False)
-                messagebox.showinfo("Success", f"Data exported to {filename}")
-                
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Error exporting data: {str(e)}")
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        
+        if filename:
+            # The saved file is already clean CSV, so stream it across unchanged
+            self.run_io(lambda: shutil.copyfile(self.user_data_file, filename),
+                        lambda _: messagebox.showinfo("Success", f"Data exported to {filename}"),
+                        "Export Error", "Error exporting data")
             
     def retrain_model(self):
         """Retrain model with updated data"""
         result = messagebox.askyesno("Retrain Model", 
                                    "This will retrain the model with the latest data. Continue?")
         if result:
-            self.predict_button.config(state='disabled')
-            self.load_model_async()
+            self.start_retrain()
+            
+    def start_retrain(self):
+        """Refit the model on the latest data in background"""
+        self.predict_button.config(state='disabled')
+        # Pending records are written by the training worker
+        new_records, self._pending_main_records = self._pending_main_records, []
+        self.clear_model_cache()
+        self.load_model_async(new_records)
             
     def run(self):
         """Start the application"""
@@ -4,22 +4,88 @@ Heart Disease Prediction System - GUI Version
 A beautiful and user-friendly graphical interface for heart disease risk assessment
 """
 
+import os
+
+# One BLAS/OpenMP thread: for a 13-feature model, spinning up thread pools costs more
+# than it saves. Set before numpy/sklearn load their native libraries.
+os.environ.setdefault('OMP_NUM_THREADS', '1')
+os.environ.setdefault('OPENBLAS_NUM_THREADS', '1')
+os.environ.setdefault('MKL_NUM_THREADS', '1')
+
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import numpy as np
-import pandas as pd
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score
-import os
 import threading
+import bisect
+import concurrent.futures
+import heart_model
+
+# Valid input ranges and names for validation messages, in model column order
+_MINS = np.array([heart_model.RANGES[f][0] for f in heart_model.FEATURES], dtype=np.float64)
+_MAXS = np.array([heart_model.RANGES[f][1] for f in heart_model.FEATURES], dtype=np.float64)
+_LABELS = tuple(heart_model.FEATURE_LABELS[f] for f in heart_model.FEATURES)
 
 class HeartDiseasePredictorGUI:
     """Heart Disease Prediction System with Modern GUI"""
     
+    # Column order expected by the model
+    FEATURE_ORDER = heart_model.FEATURES
+    
+    # Shown in the results area before the first prediction
+    INITIAL_MESSAGE = ("Enter patient information above and click 'Predict Risk' to see results.\n\n"
+                       "⚠️  IMPORTANT: This tool is for educational purposes only.\n"
+                       "Always consult healthcare professionals for medical advice.")
+    
+    # Integer fields are truncated like Tk's IntVar did
+    INTEGER_FIELDS = np.array([feature != 'oldpeak' for feature in FEATURE_ORDER])
+    
+    # Text the input fields start with
+    DEFAULTS = {feature: '0.0' if feature == 'oldpeak' else '0' for feature in FEATURE_ORDER}
+    
+    # Names used in the results summary
+    FEATURE_NAMES = {
+        'age': 'Age', 'sex': 'Sex', 'cp': 'Chest Pain Type',
+        'trestbps': 'Resting BP', 'chol': 'Cholesterol', 'fbs': 'Fasting Blood Sugar',
+        'restecg': 'Resting ECG', 'thalach': 'Max Heart Rate', 'exang': 'Exercise Angina',
+        'oldpeak': 'ST Depression', 'slope': 'ST Slope', 'ca': 'Major Vessels', 'thal': 'Thalassemia'
+    }
+    
+    # Summary names in model column order, so rendering needs no dict lookups
+    SUMMARY_NAMES = tuple(map(FEATURE_NAMES.get, FEATURE_ORDER))
+    
+    # Risk bands: bisect(RISK_EDGES, risk_percentage) indexes RISK_LABELS
+    RISK_EDGES = (25, 50, 75)
+    RISK_LABELS = ("🟢 Very Low Risk (0-25%)", "🟡 Low Risk (25-50%)",
+                   "🟠 Moderate Risk (50-75%)", "🔴 High Risk (75-100%)")
+    
+    # Result lines for prediction 0 and 1
+    VERDICTS = ("✅ RESULT: LOW RISK\n   The model indicates a LOW risk of heart disease.",
+                "⚠️  RESULT: HIGH RISK\n   The model indicates a HIGH risk of heart disease.")
+    
+    # Full results report, filled in with a single format call
+    REPORT_TMPL = ("=" * 60 + "\n"
+                   "📋 HEART DISEASE RISK ASSESSMENT RESULTS\n"
+                   + "=" * 60 + "\n\n"
+                   "📊 Input Summary:\n"
+                   + "-" * 30 + "\n"
+                   "{inputs}"
+                   "\n" + "=" * 60 + "\n"
+                   "{verdict}\n"
+                   "   Confidence: {confidence:.1f}%\n"
+                   "\n📊 Risk Score: {risk_pct:.1f}%\n"
+                   "\n📈 Risk Interpretation:\n"
+                   "   {risk_label}\n"
+                   "\n" + "=" * 60 + "\n"
+                   "⚠️  IMPORTANT DISCLAIMER:\n"
+                   "This prediction is for educational purposes only.\n"
+                   "Always consult with healthcare professionals for medical advice.\n"
+                   + "=" * 60 + "\n")
+    
     def __init__(self):
         self.model = None
         self.data_file = 'heart_disease_data.csv'
+        # Predictions run off the Tk thread, one at a time
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         self.setup_gui()
         self.load_model_async()
         
@@ -92,56 +158,54 @@ class HeartDiseasePredictorGUI:
         self.results_text.grid(row=0, column=0, sticky=(tk.W, tk.E))
         
         # Initial results message
-        self.results_text.insert(tk.END, "Enter patient information above and click 'Predict Risk' to see results.\n\n")
-        self.results_text.insert(tk.END, "⚠️  IMPORTANT: This tool is for educational purposes only.\n")
-        self.results_text.insert(tk.END, "Always consult healthcare professionals for medical advice.")
+        self.results_text.insert(tk.END, self.INITIAL_MESSAGE)
         self.results_text.config(state=tk.DISABLED)
         
     def create_input_fields(self, parent):
         """Create input fields for all features"""
-        self.input_vars = {}
-        
-        # Feature definitions with descriptions and ranges
-        features = [
-            ('age', 'Age (years)', 'Patient age in years', 1, 120),
-            ('sex', 'Sex', '0 = Female, 1 = Male', 0, 1),
-            ('cp', 'Chest Pain Type', '0=Typical angina, 1=Atypical angina, 2=Non-anginal, 3=Asymptomatic', 0, 3),
-            ('trestbps', 'Resting Blood Pressure', 'Resting blood pressure in mm Hg', 50, 300),
-            ('chol', 'Cholesterol', 'Serum cholesterol in mg/dl', 100, 600),
-            ('fbs', 'Fasting Blood Sugar', 'Fasting blood sugar > 120 mg/dl (0=No, 1=Yes)', 0, 1),
-            ('restecg', 'Resting ECG', '0=Normal, 1=ST-T abnormality, 2=LV hypertrophy', 0, 2),
-            ('thalach', 'Max Heart Rate', 'Maximum heart rate achieved', 50, 250),
-            ('exang', 'Exercise Angina', 'Exercise induced angina (0=No, 1=Yes)', 0, 1),
-            ('oldpeak', 'ST Depression', 'ST depression induced by exercise', 0.0, 10.0),
-            ('slope', 'ST Slope', 'Slope of peak exercise ST segment (0=Up, 1=Flat, 2=Down)', 0, 2),
-            ('ca', 'Major Vessels', 'Number of major vessels colored by fluoroscopy (0-4)', 0, 4),
-            ('thal', 'Thalassemia', '0=Normal, 1=Fixed defect, 2=Reversible defect, 3=Not described', 0, 3)
-        ]
+        self.entries = {}
+        
+        # Short hints shown under each field (ranges come from heart_model.RANGES)
+        hints = {
+            'age': 'Patient age in years',
+            'sex': '0 = Female, 1 = Male',
+            'cp': '0=Typical angina, 1=Atypical angina, 2=Non-anginal, 3=Asymptomatic',
+            'trestbps': 'Resting blood pressure in mm Hg',
+            'chol': 'Serum cholesterol in mg/dl',
+            'fbs': 'Fasting blood sugar > 120 mg/dl (0=No, 1=Yes)',
+            'restecg': '0=Normal, 1=ST-T abnormality, 2=LV hypertrophy',
+            'thalach': 'Maximum heart rate achieved',
+            'exang': 'Exercise induced angina (0=No, 1=Yes)',
+            'oldpeak': 'ST depression induced by exercise',
+            'slope': 'Slope of peak exercise ST segment (0=Up, 1=Flat, 2=Down)',
+            'ca': 'Number of major vessels colored by fluoroscopy (0-4)',
+            'thal': '0=Normal, 1=Fixed defect, 2=Reversible defect, 3=Not described'
+        }
         
-        row = 2
-        for feature, label, description, min_val, max_val in features:
-            # Label
-            ttk.Label(parent, text=f"{label}:", style='Heading.TLabel').grid(
-                row=row, column=0, sticky=tk.W, pady=2)
+        # Create all widgets first
+        rows = []
+        for feature in self.FEATURE_ORDER:
+            label = 'Age (years)' if feature == 'age' else heart_model.FEATURE_LABELS[feature]
+            description = hints[feature]
+            min_val, max_val = heart_model.RANGES[feature]
+            label_widget = ttk.Label(parent, text=f"{label}:", style='Heading.TLabel')
             
-            # Input field
-            if feature == 'oldpeak':
-                self.input_vars[feature] = tk.DoubleVar()
-                spinbox = ttk.Spinbox(parent, from_=min_val, to=max_val, increment=0.1,
-                                     textvariable=self.input_vars[feature], width=15)
-            else:
-                self.input_vars[feature] = tk.IntVar()
-                spinbox = ttk.Spinbox(parent, from_=min_val, to=max_val, increment=1,
-                                     textvariable=self.input_vars[feature], width=15)
-            
-            spinbox.grid(row=row, column=1, sticky=tk.W, padx=10, pady=2)
+            # Input field, read as text only when predicting
+            spinbox = ttk.Spinbox(parent, from_=min_val, to=max_val,
+                                 increment=0.1 if feature == 'oldpeak' else 1, width=15)
+            spinbox.insert(0, self.DEFAULTS[feature])
+            self.entries[feature] = spinbox
             
-            # Description
             desc_label = ttk.Label(parent, text=f"({description})", style='Info.TLabel',
                                   foreground='gray')
+            rows.append((label_widget, spinbox, desc_label))
+        
+        # Then lay them out in one pass
+        for i, (label_widget, spinbox, desc_label) in enumerate(rows):
+            row = 2 + 2 * i
+            label_widget.grid(row=row, column=0, sticky=tk.W, pady=2)
+            spinbox.grid(row=row, column=1, sticky=tk.W, padx=10, pady=2)
             desc_label.grid(row=row+1, column=1, sticky=tk.W, padx=10, pady=(0, 5))
-            
-            row += 2
     
     def load_model_async(self):
         """Load and train the model in a separate thread"""
@@ -152,31 +216,14 @@ class HeartDiseasePredictorGUI:
                         f"❌ Error: '{self.data_file}' not found!", 'red'))
                     return
                 
-                # Update status
-                self.root.after(0, lambda: self.update_status("📊 Loading dataset...", 'blue'))
+                # Status shown while a slow step runs (skipped when the cache is fresh)
+                messages = {'loading': "📊 Loading dataset...", 'training': "🤖 Training model..."}
+                def on_status(step):
+                    self.root.after(0, lambda: self.update_status(messages[step], 'blue'))
                 
-                # Load data
-                heart_data = pd.read_csv(self.data_file)
-                
-                # Prepare data
-                X = heart_data.drop(columns='target', axis=1)
-                y = heart_data['target']
-                
-                # Split data
-                X_train, X_test, y_train, y_test = train_test_split(
-                    X, y, test_size=0.2, stratify=y, random_state=42
-                )
-                
-                # Update status
-                self.root.after(0, lambda: self.update_status("🤖 Training model...", 'blue'))
-                
-                # Train model
-                self.model = LogisticRegression(random_state=42, max_iter=1000)
-                self.model.fit(X_train, y_train)
-                
-                # Calculate accuracy
-                test_predictions = self.model.predict(X_test)
-                accuracy = accuracy_score(y_test, test_predictions)
+                # Reuse the cached model while the dataset is unchanged, otherwise train
+                model, accuracy = heart_model.get_model(self.data_file, on_status=on_status)
+                self.set_model(model)
                 
                 # Update status and enable predict button
                 self.root.after(0, lambda: self.update_status(
@@ -190,42 +237,32 @@ class HeartDiseasePredictorGUI:
         thread = threading.Thread(target=load_model, daemon=True)
         thread.start()
     
+    def set_model(self, model):
+        """Install a fitted model and keep its weights for direct scoring"""
+        self._w, self._b = heart_model.model_weights(model)
+        self.model = model
+    
     def update_status(self, message, color):
         """Update status label"""
         self.status_label.config(text=message, foreground=color)
     
     def validate_inputs(self):
-        """Validate all input fields"""
+        """Validate all input fields, returning them as an array (None if invalid)"""
+        raw = [self.entries[feature].get() for feature in self.FEATURE_ORDER]
         try:
-            # Check if all fields have values
-            for feature, var in self.input_vars.items():
-                value = var.get()
-                if feature == 'oldpeak':
-                    if not (0 <= value <= 10):
-                        raise ValueError(f"ST Depression must be between 0 and 10")
-                else:
-                    # Define valid ranges for each feature
-                    ranges = {
-                        'age': (1, 120), 'sex': (0, 1), 'cp': (0, 3), 'trestbps': (50, 300),
-                        'chol': (100, 600), 'fbs': (0, 1), 'restecg': (0, 2), 'thalach': (50, 250),
-                        'exang': (0, 1), 'slope': (0, 2), 'ca': (0, 4), 'thal': (0, 3)
-                    }
-                    min_val, max_val = ranges[feature]
-                    if not (min_val <= value <= max_val):
-                        feature_names = {
-                            'age': 'Age', 'sex': 'Sex', 'cp': 'Chest Pain Type',
-                            'trestbps': 'Resting Blood Pressure', 'chol': 'Cholesterol',
-                            'fbs': 'Fasting Blood Sugar', 'restecg': 'Resting ECG',
-                            'thalach': 'Max Heart Rate', 'exang': 'Exercise Angina',
-                            'slope': 'ST Slope', 'ca': 'Major Vessels', 'thal': 'Thalassemia'
-                        }
-                        raise ValueError(f"{feature_names[feature]} must be between {min_val} and {max_val}")
-            
-            return True
-            
-        except ValueError as e:
-            messagebox.showerror("Input Error", str(e))
-            return False
+            x = np.fromiter((float(value) for value in raw), dtype=np.float64, count=len(raw))
+        except ValueError:
+            messagebox.showerror("Input Error", "Please enter numeric values in all fields")
+            return None
+        np.trunc(x, out=x, where=self.INTEGER_FIELDS)
+        
+        # Any value moved by clipping is out of range (NaN never equals itself, so it fails too)
+        bad = np.flatnonzero(np.clip(x, _MINS, _MAXS) != x)
+        if bad.size:
+            i = bad[0]
+            messagebox.showerror("Input Error", f"{_LABELS[i]} must be between {_MINS[i]:g} and {_MAXS[i]:g}")
+            return None
+        return x
     
     def predict_risk(self):
         """Make prediction and display results"""
@@ -233,99 +270,67 @@ class HeartDiseasePredictorGUI:
             messagebox.showerror("Error", "Model not loaded yet. Please wait.")
             return
         
-        if not self.validate_inputs():
+        x = self.validate_inputs()
+        if x is None:
+            return
+        
+        # Input values as entered, for the summary
+        input_data = [value if feature == 'oldpeak' else int(value)
+                      for feature, value in zip(self.FEATURE_ORDER, x.tolist())]
+        
+        self.predict_button.config(state='disabled')
+        future = self._executor.submit(self.score, x)
+        self.root.after(50, self._poll_prediction, future, input_data)
+    
+    def score(self, x):
+        """Return (prediction, probability) for one input row (runs in worker thread)"""
+        return heart_model.predict(self._w, self._b, x)
+    
+    def _poll_prediction(self, future, input_data):
+        """Display the prediction on the Tk thread once the worker is done"""
+        if not future.done():
+            self.root.after(50, self._poll_prediction, future, input_data)
             return
         
+        self.predict_button.config(state='normal')
         try:
-            # Get input values
-            feature_order = ['age', 'sex', 'cp', 'trestbps', 'chol', 'fbs', 'restecg', 
-                           'thalach', 'exang', 'oldpeak', 'slope', 'ca', 'thal']
-            
-            input_data = [self.input_vars[feature].get() for feature in feature_order]
-            input_array = np.array(input_data).reshape(1, -1)
-            
-            # Make prediction
-            prediction = self.model.predict(input_array)[0]
-            probability = self.model.predict_proba(input_array)[0]
-            
-            # Display results
-            self.display_results(prediction, probability, input_data, feature_order)
-            
+            prediction, probability = future.result()
         except Exception as e:
             messagebox.showerror("Prediction Error", f"An error occurred: {str(e)}")
+            return
+        
+        # Display results
+        self.display_results(prediction, probability, input_data)
     
-    def display_results(self, prediction, probability, input_data, feature_order):
+    def display_results(self, prediction, probability, input_data):
         """Display prediction results in the text area"""
-        self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete(1.0, tk.END)
-        
-        # Header
-        self.results_text.insert(tk.END, "=" * 60 + "\n")
-        self.results_text.insert(tk.END, "📋 HEART DISEASE RISK ASSESSMENT RESULTS\n")
-        self.results_text.insert(tk.END, "=" * 60 + "\n\n")
-        
-        # Input summary
-        self.results_text.insert(tk.END, "📊 Input Summary:\n")
-        self.results_text.insert(tk.END, "-" * 30 + "\n")
-        
-        feature_names = {
-            'age': 'Age', 'sex': 'Sex', 'cp': 'Chest Pain Type',
-            'trestbps': 'Resting BP', 'chol': 'Cholesterol', 'fbs': 'Fasting Blood Sugar',
-            'restecg': 'Resting ECG', 'thalach': 'Max Heart Rate', 'exang': 'Exercise Angina',
-            'oldpeak': 'ST Depression', 'slope': 'ST Slope', 'ca': 'Major Vessels', 'thal': 'Thalassemia'
-        }
-        
-        for i, feature in enumerate(feature_order):
-            self.results_text.insert(tk.END, f"   • {feature_names[feature]}: {input_data[i]}\n")
-        
-        # Prediction results
-        self.results_text.insert(tk.END, f"\n{'='*60}\n")
-        
         risk_percentage = probability[1] * 100
-        confidence = max(probability) * 100
-        
-        if prediction == 0:
-            self.results_text.insert(tk.END, "✅ RESULT: LOW RISK\n")
-            self.results_text.insert(tk.END, f"   The model indicates a LOW risk of heart disease.\n")
-            self.results_text.insert(tk.END, f"   Confidence: {confidence:.1f}%\n")
-        else:
-            self.results_text.insert(tk.END, "⚠️  RESULT: HIGH RISK\n")
-            self.results_text.insert(tk.END, f"   The model indicates a HIGH risk of heart disease.\n")
-            self.results_text.insert(tk.END, f"   Confidence: {confidence:.1f}%\n")
-        
-        self.results_text.insert(tk.END, f"\n📊 Risk Score: {risk_percentage:.1f}%\n")
         
-        # Risk interpretation
-        self.results_text.insert(tk.END, f"\n📈 Risk Interpretation:\n")
-        if risk_percentage < 25:
-            self.results_text.insert(tk.END, "   🟢 Very Low Risk (0-25%)\n")
-        elif risk_percentage < 50:
-            self.results_text.insert(tk.END, "   🟡 Low Risk (25-50%)\n")
-        elif risk_percentage < 75:
-            self.results_text.insert(tk.END, "   🟠 Moderate Risk (50-75%)\n")
-        else:
-            self.results_text.insert(tk.END, "   🔴 High Risk (75-100%)\n")
-        
-        # Disclaimer
-        self.results_text.insert(tk.END, f"\n{'='*60}\n")
-        self.results_text.insert(tk.END, "⚠️  IMPORTANT DISCLAIMER:\n")
-        self.results_text.insert(tk.END, "This prediction is for educational purposes only.\n")
-        self.results_text.insert(tk.END, "Always consult with healthcare professionals for medical advice.\n")
-        self.results_text.insert(tk.END, "=" * 60 + "\n")
+        text = self.REPORT_TMPL.format(
+            inputs="".join(f"   • {name}: {value}\n"
+                           for name, value in zip(self.SUMMARY_NAMES, input_data)),
+            verdict=self.VERDICTS[prediction],
+            confidence=max(probability) * 100,
+            risk_pct=risk_percentage,
+            risk_label=self.RISK_LABELS[bisect.bisect(self.RISK_EDGES, risk_percentage)]
+        )
         
+        # Replace the text with a single insert
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, text)
         self.results_text.config(state=tk.DISABLED)
     
     def clear_fields(self):
         """Clear all input fields"""
-        for var in self.input_vars.values():
-            var.set(0)
+        for feature, entry in self.entries.items():
+            entry.delete(0, tk.END)
+            entry.insert(0, self.DEFAULTS[feature])
         
         # Clear results
         self.results_text.config(state=tk.NORMAL)
         self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, "Enter patient information above and click 'Predict Risk' to see results.\n\n")
-        self.results_text.insert(tk.END, "⚠️  IMPORTANT: This tool is for educational purposes only.\n")
-        self.results_text.insert(tk.END, "Always consult healthcare professionals for medical advice.")
+        self.results_text.insert(tk.END, self.INITIAL_MESSAGE)
         self.results_text.config(state=tk.DISABLED)
     
     def run(self):
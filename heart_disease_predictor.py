@@ -5,13 +5,17 @@ A user-friendly machine learning application for predicting heart disease risk
 using logistic regression.
 """
 
-import numpy as np
-import pandas as pd
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score, classification_report
 import os
+
+# One BLAS/OpenMP thread: for a 13-feature model, spinning up thread pools costs more
+# than it saves. Set before numpy/sklearn load their native libraries.
+os.environ.setdefault('OMP_NUM_THREADS', '1')
+os.environ.setdefault('OPENBLAS_NUM_THREADS', '1')
+os.environ.setdefault('MKL_NUM_THREADS', '1')
+
+import numpy as np
 import sys
+import heart_model
 
 class HeartDiseasePredictor:
     """Heart Disease Prediction System using Logistic Regression"""
@@ -19,25 +23,8 @@ class HeartDiseasePredictor:
     def __init__(self, data_file='heart_disease_data.csv'):
         self.data_file = data_file
         self.model = None
-        self.feature_names = [
-            'age', 'sex', 'cp', 'trestbps', 'chol', 'fbs', 
-            'restecg', 'thalach', 'exang', 'oldpeak', 'slope', 'ca', 'thal'
-        ]
-        self.feature_descriptions = {
-            'age': 'Age (years)',
-            'sex': 'Sex (0: Female, 1: Male)',
-            'cp': 'Chest Pain Type (0: Typical angina, 1: Atypical angina, 2: Non-anginal pain, 3: Asymptomatic)',
-            'trestbps': 'Resting Blood Pressure (mm Hg)',
-            'chol': 'Serum Cholesterol (mg/dl)',
-            'fbs': 'Fasting Blood Sugar > 120 mg/dl (0: False, 1: True)',
-            'restecg': 'Resting ECG Results (0: Normal, 1: ST-T wave abnormality, 2: Left ventricular hypertrophy)',
-            'thalach': 'Maximum Heart Rate Achieved',
-            'exang': 'Exercise Induced Angina (0: No, 1: Yes)',
-            'oldpeak': 'ST Depression Induced by Exercise',
-            'slope': 'Slope of Peak Exercise ST Segment (0: Upsloping, 1: Flat, 2: Downsloping)',
-            'ca': 'Number of Major Vessels Colored by Fluoroscopy (0-4)',
-            'thal': 'Thalassemia (0: Normal, 1: Fixed defect, 2: Reversible defect, 3: Not described)'
-        }
+        self.feature_names = list(heart_model.FEATURES)
+        self.feature_descriptions = heart_model.DESCRIPTIONS
         
     def load_and_prepare_data(self):
         """Load and prepare the dataset for training"""
@@ -48,7 +35,7 @@ class HeartDiseasePredictor:
                 return False
                 
             print("📊 Loading heart disease dataset...")
-            self.heart_data = pd.read_csv(self.data_file)
+            self.heart_data = heart_model.load_dataset(self.data_file)
             
             # Basic data info
             print(f"✅ Dataset loaded successfully!")
@@ -66,34 +53,39 @@ class HeartDiseasePredictor:
             print(f"❌ Error loading data: {str(e)}")
             return False
     
+    def set_model(self, model):
+        """Install a fitted model and keep its weights for direct scoring"""
+        self._w, self._b = heart_model.model_weights(model)
+        self.model = model
+    
+    def load_cached_model(self):
+        """Load the cached model if the dataset hasn't changed since it was trained"""
+        cache = heart_model.load_cached_model(self.data_file)
+        if not cache:
+            return False
+        
+        self.set_model(cache['model'])
+        print("✅ Loaded cached model (dataset unchanged)")
+        print(f"   • Training accuracy: {cache['train_accuracy']:.3f}")
+        print(f"   • Test accuracy: {cache['accuracy']:.3f}")
+        return True
+    
     def train_model(self):
         """Train the logistic regression model"""
         print("\n🤖 Training the prediction model...")
         
-        # Prepare features and target
-        X = self.heart_data.drop(columns='target', axis=1)
-        y = self.heart_data['target']
-        
-        # Split the data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, stratify=y, random_state=42
-        )
-        
-        # Train the model
-        self.model = LogisticRegression(random_state=42, max_iter=1000)
-        self.model.fit(X_train, y_train)
-        
-        # Evaluate the model
-        train_predictions = self.model.predict(X_train)
-        test_predictions = self.model.predict(X_test)
-        
-        train_accuracy = accuracy_score(y_train, train_predictions)
-        test_accuracy = accuracy_score(y_test, test_predictions)
+        # Train and evaluate the model
+        model, train_accuracy, test_accuracy = heart_model.train_model(self.heart_data)
+        self.set_model(model)
         
         print(f"✅ Model trained successfully!")
         print(f"   • Training accuracy: {train_accuracy:.3f}")
         print(f"   • Test accuracy: {test_accuracy:.3f}")
         
+        try:
+            heart_model.save_model_cache(self.data_file, model, train_accuracy, test_accuracy)
+        except OSError as e:
+            print(f"   ⚠️  Could not cache model: {str(e)}")
         return True
     
     def get_user_input(self):
@@ -106,22 +98,7 @@ class HeartDiseasePredictor:
         
         user_data = {}
         
-        # Define input ranges for validation
-        input_ranges = {
-            'age': (1, 120),
-            'sex': (0, 1),
-            'cp': (0, 3),
-            'trestbps': (50, 300),
-            'chol': (100, 600),
-            'fbs': (0, 1),
-            'restecg': (0, 2),
-            'thalach': (50, 250),
-            'exang': (0, 1),
-            'oldpeak': (0, 10),
-            'slope': (0, 2),
-            'ca': (0, 4),
-            'thal': (0, 3)
-        }
+        input_ranges = heart_model.RANGES
         
         for feature in self.feature_names:
             while True:
@@ -152,14 +129,18 @@ class HeartDiseasePredictor:
     def make_prediction(self, user_data):
         """Make prediction based on user input"""
         # Convert to numpy array in the correct order
-        input_array = np.array([user_data[feature] for feature in self.feature_names])
-        input_reshaped = input_array.reshape(1, -1)
+        input_array = np.array([user_data[feature] for feature in self.feature_names], dtype=np.float32)
         
-        # Make prediction
-        prediction = self.model.predict(input_reshaped)[0]
-        probability = self.model.predict_proba(input_reshaped)[0]
+        # Make prediction with the logistic function directly
+        return heart_model.predict(self._w, self._b, input_array)
+    
+    def predict_many(self, rows):
+        """Make predictions for a list of user_data dicts with one vectorized pass"""
+        input_array = np.array([[row[feature] for feature in self.feature_names] for row in rows],
+                               dtype=np.float32)
         
-        return prediction, probability
+        # Same logistic function as make_prediction, applied to every row at once
+        return heart_model.predict_many(self._w, self._b, input_array)
     
     def display_results(self, prediction, probability, user_data):
         """Display prediction results in a user-friendly format"""
@@ -200,12 +181,13 @@ class HeartDiseasePredictor:
         print("🏥 Heart Disease Prediction System")
         print("=" * 50)
         
-        # Load data and train model
-        if not self.load_and_prepare_data():
-            return
-        
-        if not self.train_model():
-            return
+        # Reuse the cached model, otherwise load data and train
+        if not self.load_cached_model():
+            if not self.load_and_prepare_data():
+                return
+            
+            if not self.train_model():
+                return
         
         while True:
             try:
@@ -4,23 +4,84 @@ Heart Disease Prediction System - Web Version
 A modern web-based interface for heart disease risk assessment
 """
 
-from flask import Flask, render_template, request, jsonify
+import os
+
+# One BLAS/OpenMP thread per process: under a multi-worker server such as gunicorn,
+# each worker's own thread pool would oversubscribe the CPU. Set before numpy/sklearn load.
+os.environ.setdefault('OMP_NUM_THREADS', '1')
+os.environ.setdefault('OPENBLAS_NUM_THREADS', '1')
+os.environ.setdefault('MKL_NUM_THREADS', '1')
+
+from flask import Flask, render_template, request
 import numpy as np
-import pandas as pd
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import cross_val_score
 from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score
-import os
+from scipy.special import expit
 import json
+import math
+import hashlib
+import hmac
+import bisect
+import functools
+import glob
+import threading
+import joblib
+import heart_model
+
+# Prefer orjson for request and response bodies, falling back to the stdlib
+try:
+    import orjson
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+    
+    json_loads = json.loads
 
 app = Flask(__name__)
 
+# Input fields in the column order the model was trained on
+REQUIRED_FIELDS = ('age', 'sex', 'cp', 'trestbps', 'chol', 'fbs',
+                   'restecg', 'thalach', 'exang', 'oldpeak', 'slope', 'ca', 'thal')
+
+# Risk levels: bisect_right(RISK_THRESHOLDS, score) indexes RISK_LEVELS
+RISK_THRESHOLDS = (25, 50, 75)
+RISK_LEVELS = ('Very Low', 'Low', 'Moderate', 'High')
+
+# Every possible risk message, indexed by [prediction][confidence in tenths of a percent]
+RISK_MESSAGES = tuple(
+    tuple(f"The model indicates a {level} risk of heart disease with {i / 10:.1f}% confidence."
+          for i in range(1001))
+    for level in ('LOW', 'HIGH')
+)
+
+# Pre-encoded bodies for the "Missing field" 400s, so bad requests skip building and encoding a dict
+MISSING_FIELD_BODIES = {field: json_dumps({'error': f'Missing field: {field}'})
+                        for field in REQUIRED_FIELDS + ('records', 'target')}
+
+# Health check body, served as-is
+HEALTH_OK = b'{"status":"ok"}'
+
+# Admin routes change the served model. They stay disabled (403) unless HEART_ADMIN_TOKEN
+# is set, and then require that token in the X-Admin-Token header.
+ADMIN_TOKEN_VAR = 'HEART_ADMIN_TOKEN'
+FORBIDDEN_BODY = json_dumps({'error': 'Forbidden'})
+
+# Worker count the server runs (set by gunicorn.conf.py). Admin changes only reach the
+# worker that handles them, so with more than one worker they are refused.
+WORKERS_VAR = 'HEART_WEB_WORKERS'
+MULTI_WORKER_BODY = json_dumps({'error': 'Admin routes are disabled when running more than one worker'})
+
 class HeartDiseaseModel:
     """Heart Disease Prediction Model"""
     
     def __init__(self):
         self.model = None
         self.accuracy = 0
+        self._warm = None
+        # Bumped whenever the served weights change; part of every prediction cache key
+        self.version = 0
         self.is_trained = False
         self.load_and_train()
     
@@ -32,25 +93,51 @@ class HeartDiseaseModel:
                 print(f"Warning: {data_file} not found!")
                 return False
             
-            # Load and prepare data
-            heart_data = pd.read_csv(data_file)
-            X = heart_data.drop(columns='target', axis=1)
-            y = heart_data['target']
+            # Reuse the model cached for this exact dataset content
+            with open(data_file, 'rb') as f:
+                csv_hash = hashlib.md5(f.read()).hexdigest()
+            model_path = f'model_{csv_hash}.joblib'
+            if os.path.exists(model_path):
+                try:
+                    model, self.accuracy = joblib.load(model_path)
+                    self.set_model(model)
+                    self.is_trained = True
+                    print(f"Loaded cached model. Accuracy: {self.accuracy:.3f}")
+                    return True
+                except Exception:
+                    pass  # Unreadable cache, retrain below
             
-            # Split data
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, stratify=y, random_state=42
-            )
+            # Load data
+            data = self.load_data(data_file)
+            X = data[:, :-1]
+            y = data[:, -1].astype(np.int8)
             
-            # Train model
-            self.model = LogisticRegression(random_state=42, max_iter=1000)
-            self.model.fit(X_train, y_train)
+            # Estimate accuracy with stratified 5-fold cross-validation. Folds run
+            # serially: on 300 rows, starting worker processes costs more than fitting.
+            self.accuracy = float(cross_val_score(
+                LogisticRegression(random_state=42, max_iter=1000), X, y, cv=5
+            ).mean())
             
-            # Calculate accuracy
-            test_predictions = self.model.predict(X_test)
-            self.accuracy = accuracy_score(y_test, test_predictions)
+            # Train the served model on the full dataset
+            model = LogisticRegression(random_state=42, max_iter=1000)
+            model.fit(X, y)
+            self.set_model(model)
             self.is_trained = True
             
+            # Cache for the next start; a failed write only costs a retrain
+            try:
+                joblib.dump((self.model, self.accuracy), model_path, compress=3)
+            except OSError:
+                pass
+            else:
+                # Models trained on earlier versions of the CSV are never loaded again
+                for path in glob.glob('model_*.joblib'):
+                    if path != model_path:
+                        try:
+                            os.remove(path)
+                        except OSError:
+                            pass
+            
             print(f"Model trained successfully! Accuracy: {self.accuracy:.3f}")
             return True
             
@@ -58,16 +145,85 @@ class HeartDiseaseModel:
             print(f"Error training model: {str(e)}")
             return False
     
+    def load_data(self, data_file):
+        """Return the dataset as a float32 (N, 14) array, memory-mapped from an up-to-date .npy copy"""
+        npy_file = os.path.splitext(data_file)[0] + '.npy'
+        if (os.path.exists(npy_file)
+                and os.path.getmtime(npy_file) >= os.path.getmtime(data_file)):
+            try:
+                return np.load(npy_file, mmap_mode='r')
+            except (OSError, ValueError):
+                pass  # Unreadable copy, parse the CSV
+        
+        # Columns in REQUIRED_FIELDS order (then target), found by their position in the header
+        with open(data_file, encoding='utf-8-sig') as f:
+            header = f.readline().strip().split(',')
+        columns = [header.index(field) for field in REQUIRED_FIELDS + ('target',)]
+        data = np.loadtxt(data_file, delimiter=',', skiprows=1, usecols=columns,
+                          dtype=np.float32, encoding='utf-8-sig')
+        try:
+            np.save(npy_file, data)
+        except OSError:
+            pass  # The .npy copy is only a speed-up
+        return data
+    
+    def set_model(self, model):
+        """Install a fitted model and keep its weights for direct scoring"""
+        # Weights and bias are published as one tuple so a reader never mixes old and new
+        self._wb = (model.coef_.ravel().astype(np.float32), float(model.intercept_[0]))
+        self.model = model
+        self._warm = None
+        self.version += 1
+        # Cached predictions belong to the previous weights
+        predict_cached.cache_clear()
+    
+    def partial_update(self, x, target):
+        """Nudge the served weights toward one labelled float64 record with an SGD step"""
+        if self._warm is None:
+            self._warm = heart_model.warm_start_sgd(self.model)
+        
+        self._warm.partial_fit(x.reshape(1, -1), [target], classes=np.array([0, 1]))
+        self._wb = (self._warm.coef_.ravel().astype(np.float32), float(self._warm.intercept_[0]))
+        self.version += 1
+        predict_cached.cache_clear()
+    
     def predict(self, input_data):
-        """Make prediction"""
+        """Make prediction for one float32 array of features in REQUIRED_FIELDS order"""
         if not self.is_trained:
             return None, None
         
-        input_array = np.array(input_data).reshape(1, -1)
-        prediction = self.model.predict(input_array)[0]
-        probability = self.model.predict_proba(input_array)[0]
+        # One logistic evaluation gives both the class and its probabilities
+        w, b = self._wb
+        z = float(input_data @ w) + b
+        # Inputs aren't range-checked, so keep exp's argument non-positive to avoid overflow
+        if z >= 0:
+            p1 = 1.0 / (1.0 + math.exp(-z))
+        else:
+            e = math.exp(z)
+            p1 = e / (1.0 + e)
+        prediction = int(p1 >= 0.5)
+        probability = (1.0 - p1, p1)
         
         return prediction, probability
+    
+    def predict_many(self, X):
+        """Make predictions for an (N, 13) float32 array, returning (predictions, p1)"""
+        # Same logistic function as predict, over every row with one matrix-vector product
+        w, b = self._wb
+        p1 = expit((X @ w).astype(np.float64) + b)
+        return (p1 >= 0.5).astype(int), p1
+
+# Per-thread input array, refilled on every cache miss instead of allocating a new one
+_buffers = threading.local()
+
+@functools.lru_cache(maxsize=4096)
+def predict_cached(version, inputs):
+    """predictor.predict for a tuple of inputs, memoized per model version"""
+    buf = getattr(_buffers, 'x', None)
+    if buf is None:
+        buf = _buffers.x = np.empty(len(REQUIRED_FIELDS), dtype=np.float32)
+    buf[:] = inputs
+    return predictor.predict(buf)
 
 # Initialize model
 predictor = HeartDiseaseModel()
@@ -78,63 +234,148 @@ def index():
     return render_template('index.html', model_ready=predictor.is_trained, 
                          accuracy=predictor.accuracy)
 
+def json_response(obj, status=200):
+    """Build a JSON response encoded with json_dumps"""
+    return app.response_class(json_dumps(obj), status=status, mimetype='application/json')
+
+def admin_route(view):
+    """Guard an admin view: 403 unless enabled, the request has the token and there is one worker"""
+    @functools.wraps(view)
+    def guarded():
+        token = os.environ.get(ADMIN_TOKEN_VAR, '')
+        given = request.headers.get('X-Admin-Token', '')
+        if not token or not hmac.compare_digest(given.encode(), token.encode()):
+            return app.response_class(FORBIDDEN_BODY, status=403, mimetype='application/json')
+        if int(os.environ.get(WORKERS_VAR, '1')) > 1:
+            return app.response_class(MULTI_WORKER_BODY, status=403, mimetype='application/json')
+        return view()
+    return guarded
+
+def missing_field_response(field):
+    """Build the 400 response for a missing field from its pre-encoded body"""
+    return app.response_class(MISSING_FIELD_BODIES[field], status=400, mimetype='application/json')
+
 @app.route('/predict', methods=['POST'])
 def predict():
     """Handle prediction request"""
     try:
         if not predictor.is_trained:
-            return jsonify({'error': 'Model not trained yet'}), 500
+            return json_response({'error': 'Model not trained yet'}, 500)
         
         # Get input data
-        data = request.json
-        
-        # Validate inputs
-        required_fields = ['age', 'sex', 'cp', 'trestbps', 'chol', 'fbs', 
-                          'restecg', 'thalach', 'exang', 'oldpeak', 'slope', 'ca', 'thal']
+        data = json_loads(request.get_data())
         
-        input_data = []
-        for field in required_fields:
-            if field not in data:
-                return jsonify({'error': f'Missing field: {field}'}), 400
-            input_data.append(float(data[field]))
+        # Read all fields straight into one float32 array, matching the weights
+        try:
+            x = np.fromiter((data[field] for field in REQUIRED_FIELDS), np.float32, len(REQUIRED_FIELDS))
+        except KeyError as e:
+            return missing_field_response(e.args[0])
         
         # Make prediction
-        prediction, probability = predictor.predict(input_data)
+        prediction, probability = predict_cached(predictor.version, tuple(x.tolist()))
         
         if prediction is None:
-            return jsonify({'error': 'Prediction failed'}), 500
+            return json_response({'error': 'Prediction failed'}, 500)
         
-        # Prepare response
+        # Prepare response (predict returns plain Python numbers, so no casts are needed)
+        risk_score = probability[1] * 100
         result = {
-            'prediction': int(prediction),
-            'risk_score': float(probability[1] * 100),
-            'confidence': float(max(probability) * 100),
-            'risk_level': get_risk_level(probability[1] * 100),
+            'prediction': prediction,
+            'risk_score': risk_score,
+            'confidence': max(probability) * 100,
+            'risk_level': get_risk_level(risk_score),
             'message': get_risk_message(prediction, probability)
         }
         
-        return jsonify(result)
+        return json_response(result)
+        
+    except Exception as e:
+        return json_response({'error': str(e)}, 500)
+
+@app.route('/predict_batch', methods=['POST'])
+def predict_batch():
+    """Handle a batch of prediction records ({'records': [...]}, each like a /predict body)"""
+    try:
+        if not predictor.is_trained:
+            return json_response({'error': 'Model not trained yet'}, 500)
+        
+        data = json_loads(request.get_data())
+        
+        # One (N, 13) array for all records
+        try:
+            X = np.array([[record[field] for field in REQUIRED_FIELDS] for record in data['records']],
+                         dtype=np.float32).reshape(-1, len(REQUIRED_FIELDS))
+        except KeyError as e:
+            return missing_field_response(e.args[0])
+        
+        # Score every record at once
+        predictions, p1 = predictor.predict_many(X)
+        risk_scores = p1 * 100
+        confidences = np.maximum(p1, 1.0 - p1) * 100
+        levels = np.searchsorted(RISK_THRESHOLDS, risk_scores, side='right')
+        
+        results = [
+            {
+                'prediction': prediction,
+                'risk_score': risk_score,
+                'confidence': confidence,
+                'risk_level': RISK_LEVELS[level],
+                'message': get_risk_message(prediction, (1.0 - p, p))
+            }
+            for prediction, p, risk_score, confidence, level in zip(
+                predictions.tolist(), p1.tolist(), risk_scores.tolist(),
+                confidences.tolist(), levels.tolist())
+        ]
+        
+        return json_response(results)
+        
+    except Exception as e:
+        return json_response({'error': str(e)}, 500)
+
+@app.route('/train_incremental', methods=['POST'])
+@admin_route
+def train_incremental():
+    """Update the served model with one labelled record (a /predict body plus 'target')"""
+    try:
+        if not predictor.is_trained:
+            return json_response({'error': 'Model not trained yet'}, 500)
+        
+        data = json_loads(request.get_data())
+        try:
+            x = np.fromiter((data[field] for field in REQUIRED_FIELDS), np.float64, len(REQUIRED_FIELDS))
+            target = int(data['target'])
+        except KeyError as e:
+            return missing_field_response(e.args[0])
+        if target not in (0, 1):
+            return json_response({'error': 'target must be 0 or 1'}, 400)
+        
+        # In memory only; the next full retrain starts again from the CSV
+        predictor.partial_update(x, target)
+        return json_response({'status': 'updated'})
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
+
+@app.route('/healthz')
+def healthz():
+    """Liveness probe; returns a constant body without touching the model"""
+    return app.response_class(HEALTH_OK, mimetype='application/json')
+
+@app.route('/cache/clear', methods=['POST'])
+@admin_route
+def clear_cache():
+    """Drop all memoized predictions"""
+    predict_cached.cache_clear()
+    return json_response({'status': 'cleared'})
 
 def get_risk_level(risk_score):
     """Get risk level based on score"""
-    if risk_score < 25:
-        return 'Very Low'
-    elif risk_score < 50:
-        return 'Low'
-    elif risk_score < 75:
-        return 'Moderate'
-    else:
-        return 'High'
+    return RISK_LEVELS[bisect.bisect_right(RISK_THRESHOLDS, risk_score)]
 
 def get_risk_message(prediction, probability):
     """Get risk message"""
-    if prediction == 0:
-        return f"The model indicates a LOW risk of heart disease with {probability[0]:.1%} confidence."
-    else:
-        return f"The model indicates a HIGH risk of heart disease with {probability[1]:.1%} confidence."
+    # round(x, 1) rounds exactly like the :.1f format the table was built with
+    return RISK_MESSAGES[prediction][round(round(probability[prediction] * 100, 1) * 10)]
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
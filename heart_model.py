@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Heart Disease Prediction System - Shared Model
+Dataset loading, training, model caching and scoring shared by the app versions
+"""
+
+import os
+import math
+import numpy as np
+
+# Column order expected by the model
+FEATURES = ('age', 'sex', 'cp', 'trestbps', 'chol', 'fbs', 'restecg',
+            'thalach', 'exang', 'oldpeak', 'slope', 'ca', 'thal')
+
+# Valid input range for each feature
+RANGES = {
+    'age': (1, 120),
+    'sex': (0, 1),
+    'cp': (0, 3),
+    'trestbps': (50, 300),
+    'chol': (100, 600),
+    'fbs': (0, 1),
+    'restecg': (0, 2),
+    'thalach': (50, 250),
+    'exang': (0, 1),
+    'oldpeak': (0, 10),
+    'slope': (0, 2),
+    'ca': (0, 4),
+    'thal': (0, 3)
+}
+
+# Short names for labels and validation messages
+FEATURE_LABELS = {
+    'age': 'Age', 'sex': 'Sex', 'cp': 'Chest Pain Type',
+    'trestbps': 'Resting Blood Pressure', 'chol': 'Cholesterol', 'fbs': 'Fasting Blood Sugar',
+    'restecg': 'Resting ECG', 'thalach': 'Max Heart Rate', 'exang': 'Exercise Angina',
+    'oldpeak': 'ST Depression', 'slope': 'ST Slope', 'ca': 'Major Vessels', 'thal': 'Thalassemia'
+}
+
+# Full descriptions, including the meaning of coded values
+DESCRIPTIONS = {
+    'age': 'Age (years)',
+    'sex': 'Sex (0: Female, 1: Male)',
+    'cp': 'Chest Pain Type (0: Typical angina, 1: Atypical angina, 2: Non-anginal pain, 3: Asymptomatic)',
+    'trestbps': 'Resting Blood Pressure (mm Hg)',
+    'chol': 'Serum Cholesterol (mg/dl)',
+    'fbs': 'Fasting Blood Sugar > 120 mg/dl (0: False, 1: True)',
+    'restecg': 'Resting ECG Results (0: Normal, 1: ST-T wave abnormality, 2: Left ventricular hypertrophy)',
+    'thalach': 'Maximum Heart Rate Achieved',
+    'exang': 'Exercise Induced Angina (0: No, 1: Yes)',
+    'oldpeak': 'ST Depression Induced by Exercise',
+    'slope': 'Slope of Peak Exercise ST Segment (0: Upsloping, 1: Flat, 2: Downsloping)',
+    'ca': 'Number of Major Vessels Colored by Fluoroscopy (0-4)',
+    'thal': 'Thalassemia (0: Normal, 1: Fixed defect, 2: Reversible defect, 3: Not described)'
+}
+
+# Fitted model plus the dataset fingerprint it was trained on
+MODEL_CACHE = 'heart_model.joblib'
+
+# Smallest dtypes that hold each column's valid range
+DTYPES = {
+    'age': 'int8', 'sex': 'int8', 'cp': 'int8', 'trestbps': 'int16',
+    'chol': 'int16', 'fbs': 'int8', 'restecg': 'int8', 'thalach': 'int16',
+    'exang': 'int8', 'oldpeak': 'float32', 'slope': 'int8', 'ca': 'int8',
+    'thal': 'int8', 'target': 'int8'
+}
+
+# pandas, sklearn and joblib are imported inside the functions that need them,
+# so importing this module stays cheap when a cached model is available
+
+def load_dataset(data_file):
+    """Read the dataset, preferring an up-to-date Parquet copy of the CSV"""
+    import pandas as pd
+    
+    parquet_file = os.path.splitext(data_file)[0] + '.parquet'
+    if (os.path.exists(parquet_file)
+            and os.path.getmtime(parquet_file) >= os.path.getmtime(data_file)):
+        try:
+            return pd.read_parquet(parquet_file)
+        except Exception:
+            pass  # No Parquet engine or unreadable file, use the CSV
+    
+    data = pd.read_csv(data_file, dtype=DTYPES, engine='c')
+    try:
+        data.to_parquet(parquet_file, index=False)
+    except (ImportError, OSError):
+        pass  # Parquet is optional (needs pyarrow or fastparquet)
+    return data
+
+def train_model(heart_data):
+    """Fit the logistic regression model, returning (model, train accuracy, test accuracy)"""
+    from sklearn.model_selection import train_test_split
+    from sklearn.linear_model import LogisticRegression
+    
+    # Plain arrays (target is the last column) so sklearn skips its own conversion
+    X = heart_data.iloc[:, :-1].to_numpy(copy=False)
+    y = heart_data['target'].to_numpy(copy=False)
+    
+    # Split the data
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, stratify=y, random_state=42
+    )
+    
+    # Train the model
+    model = LogisticRegression(random_state=42, max_iter=1000)
+    model.fit(X_train, y_train)
+    
+    return model, model.score(X_train, y_train), model.score(X_test, y_test)
+
+def load_cached_model(data_file, cache=MODEL_CACHE):
+    """Return the cached model entry if it was trained on the current dataset"""
+    import joblib
+    
+    if not os.path.exists(data_file) or not os.path.exists(cache):
+        return None
+    
+    try:
+        entry = joblib.load(cache)
+    except Exception:
+        return None  # Unreadable cache, retrain instead
+    
+    stat = os.stat(data_file)
+    if (entry.get('csv_mtime'), entry.get('csv_size')) != (stat.st_mtime, stat.st_size):
+        return None
+    return entry
+
+def save_model_cache(data_file, model, train_accuracy, test_accuracy, cache=MODEL_CACHE):
+    """Cache the fitted model with the dataset's mtime and size (raises OSError on failure)"""
+    import joblib
+    
+    stat = os.stat(data_file)
+    joblib.dump({'model': model, 'csv_mtime': stat.st_mtime, 'csv_size': stat.st_size,
+                 'accuracy': test_accuracy, 'train_accuracy': train_accuracy},
+                cache, compress=3)
+
+def get_model(data_file, cache=MODEL_CACHE, on_status=None):
+    """Return (model, test accuracy), training only when the cache is missing or stale"""
+    entry = load_cached_model(data_file, cache)
+    if entry:
+        return entry['model'], entry['accuracy']
+    
+    # on_status, if given, is told when each slow step starts
+    if on_status:
+        on_status('loading')
+    heart_data = load_dataset(data_file)
+    
+    if on_status:
+        on_status('training')
+    model, train_accuracy, test_accuracy = train_model(heart_data)
+    
+    try:
+        save_model_cache(data_file, model, train_accuracy, test_accuracy, cache)
+    except OSError:
+        pass  # Caching is best effort
+    return model, test_accuracy
+
+def warm_start_sgd(model):
+    """Return an SGDClassifier seeded with a fitted model's weights, for one-record updates"""
+    from sklearn.linear_model import SGDClassifier
+    
+    # A tiny constant step keeps single updates stable on these unscaled features
+    sgd = SGDClassifier(loss='log_loss', alpha=0.0, learning_rate='constant', eta0=1e-6)
+    sgd.coef_ = model.coef_.astype(np.float64)
+    sgd.intercept_ = model.intercept_.astype(np.float64)
+    return sgd
+
+def model_weights(model):
+    """Return (weights, bias) of a fitted model for direct scoring"""
+    return model.coef_.ravel().astype(np.float32), float(model.intercept_[0])
+
+def predict(weights, bias, x):
+    """Return (prediction, (p0, p1)) for one input row using the logistic function directly"""
+    z = float(weights @ np.asarray(x, dtype=np.float32)) + bias
+    # Keep exp's argument non-positive so extreme inputs can't overflow
+    if z >= 0:
+        p1 = 1.0 / (1.0 + math.exp(-z))
+    else:
+        e = math.exp(z)
+        p1 = e / (1.0 + e)
+    return int(p1 >= 0.5), (1.0 - p1, p1)
+
+def predict_many(weights, bias, X):
+    """Return (predictions, Nx2 probabilities) for a batch of input rows"""
+    z = np.asarray(X, dtype=np.float32) @ weights + bias
+    # Same overflow-safe form as predict: exp(-|z|) never exceeds 1
+    e = np.exp(-np.abs(z))
+    p1 = np.where(z >= 0, 1.0 / (1.0 + e), e / (1.0 + e))
+    return (p1 >= 0.5).astype(int), np.column_stack((1.0 - p1, p1))